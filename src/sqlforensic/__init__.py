@@ -162,7 +162,11 @@ class DatabaseForensic:
             report.relationships = rel_result.get("explicit", [])
             report.implicit_relationships = rel_result.get("implicit", [])
 
-            sp = SPAnalyzer(connector, report.stored_procedures)
+            sp = SPAnalyzer(
+                connector,
+                report.stored_procedures,
+                workers=self.analysis_config.sp_parse_workers,
+            )
             report.sp_analysis = sp.analyze()
 
             idx = IndexAnalyzer(connector)
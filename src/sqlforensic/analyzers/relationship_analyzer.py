@@ -7,10 +7,17 @@ import re
 from typing import Any
 
 from sqlforensic.connectors.base import BaseConnector
-from sqlforensic.utils.sql_patterns import FK_NAMING_PATTERN
+from sqlforensic.utils.sql_patterns import FK_NAMING_RE
 
 logger = logging.getLogger(__name__)
 
+# "<table> [alias] JOIN <table> [alias] ON [a.]col = [b.]col"
+_JOIN_ON_RE = re.compile(
+    r"(\w+)\s+(?:\w+\s+)?JOIN\s+(\w+)\s+(?:\w+\s+)?ON\s+"
+    r"(?:\w+\.)?(\w+)\s*=\s*(?:\w+\.)?(\w+)",
+    re.IGNORECASE,
+)
+
 
 class RelationshipAnalyzer:
     """Discover explicit and implicit relationships between tables.
@@ -68,12 +75,6 @@ class RelationshipAnalyzer:
     def _discover_sp_relationships(self) -> list[dict[str, Any]]:
         """Find implicit relationships from JOIN patterns in stored procedures."""
         relationships: list[dict[str, Any]] = []
-        join_pattern = re.compile(
-            r"(\w+)\s+(?:\w+\s+)?JOIN\s+(\w+)\s+(?:\w+\s+)?ON\s+"
-            r"(?:\w+\.)?(\w+)\s*=\s*(?:\w+\.)?(\w+)",
-            re.IGNORECASE,
-        )
-
         seen: set[tuple[str, str]] = set()
 
         for sp in self.stored_procedures:
@@ -81,7 +82,7 @@ class RelationshipAnalyzer:
             if not body:
                 continue
 
-            for match in join_pattern.finditer(body):
+            for match in _JOIN_ON_RE.finditer(body):
                 table_a = match.group(1).strip('[]"')
                 table_b = match.group(2).strip('[]"')
                 col_a = match.group(3)
@@ -128,7 +129,7 @@ class RelationshipAnalyzer:
             table_name = table.get("TABLE_NAME", "")
             for col in table.get("columns", []):
                 col_name = col.get("COLUMN_NAME", "")
-                match = re.match(FK_NAMING_PATTERN, col_name)
+                match = FK_NAMING_RE.match(col_name)
                 if not match:
                     continue
 
@@ -10,6 +10,12 @@ from sqlforensic.connectors.base import BaseConnector
 
 logger = logging.getLogger(__name__)
 
+# EXEC('...' + ...) / EXEC(@sql + ...): dynamic SQL built by concatenation
+_CONCAT_EXEC_RE = re.compile(
+    r"EXEC(?:UTE)?\s*\(\s*(?:@\w+\s*\+|'[^']*'\s*\+)",
+    re.IGNORECASE,
+)
+
 
 class SecurityAnalyzer:
     """Analyze database security configuration for potential issues.
@@ -71,17 +77,12 @@ class SecurityAnalyzer:
         """Check stored procedures for security issues."""
         issues: list[dict[str, Any]] = []
 
-        dynamic_sql_pattern = re.compile(
-            r"EXEC(?:UTE)?\s*\(\s*(?:@\w+\s*\+|'[^']*'\s*\+)",
-            re.IGNORECASE,
-        )
-
         for sp in stored_procedures:
             body = sp.get("ROUTINE_DEFINITION") or ""
             sp_name = sp.get("ROUTINE_NAME", "")
 
             # Check for SQL injection risk via string concatenation in dynamic SQL
-            if dynamic_sql_pattern.search(body):
+            if _CONCAT_EXEC_RE.search(body):
                 if "sp_executesql" not in body.lower():
                     issues.append(
                         {
@@ -25,9 +25,11 @@ class SPAnalyzer:
         self,
         connector: BaseConnector,
         stored_procedures: list[dict[str, Any]],
+        workers: int = 1,
     ) -> None:
         self.connector = connector
         self.stored_procedures = stored_procedures
+        self.workers = workers
         self.parser = SPParser()
 
     def analyze(self) -> list[dict[str, Any]]:
@@ -39,9 +41,7 @@ class SPAnalyzer:
         logger.info("Starting stored procedure analysis (%d SPs)", len(self.stored_procedures))
         results: list[dict[str, Any]] = []
 
-        for sp in self.stored_procedures:
-            parsed = self.parser.parse(sp)
-
+        for parsed in self.parser.parse_many(self.stored_procedures, workers=self.workers):
             results.append(
                 {
                     "name": parsed.name,
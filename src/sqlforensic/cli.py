@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from sqlforensic.connectors.base import BaseConnector
 
 import click
-from rich.console import Console
+from rich import get_console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
@@ -23,7 +23,7 @@ from sqlforensic.utils.formatting import (
     severity_color,
 )
 
-console = Console()
+console = get_console()
 
 
 def _build_config(ctx: click.Context) -> ConnectionConfig:
@@ -465,13 +465,13 @@ def diff(**kwargs: Any) -> None:
         elif fmt == "sql":
             from sqlforensic.diff.migration_generator import MigrationGenerator
 
-            script = MigrationGenerator(
+            generator = MigrationGenerator(
                 diff_result,
                 provider=provider,
                 safe_mode=kwargs.get("safe_mode", False),
-            ).generate()
+            )
             with open(output_path, "w", encoding="utf-8") as f:
-                f.write(script)
+                generator.generate_to(f)
         console.print(f"\n[green]Report saved to:[/green] {output_path}")
 
 
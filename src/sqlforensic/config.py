@@ -79,6 +79,8 @@ class AnalysisConfig:
         implicit_confidence_threshold: Minimum confidence for implicit relationships (0-100).
         analyze_security: Include security analysis.
         analyze_sizes: Include size analysis.
+        sp_parse_workers: Worker processes for parsing stored procedures
+            (1 = in-process; more only pays off for thousands of SPs).
     """
 
     include_schemas: list[str] = field(default_factory=list)
@@ -90,3 +92,4 @@ class AnalysisConfig:
     implicit_confidence_threshold: int = 50
     analyze_security: bool = True
     analyze_sizes: bool = True
+    sp_parse_workers: int = 1
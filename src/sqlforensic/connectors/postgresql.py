@@ -80,7 +80,9 @@ class PostgreSQLConnector(BaseConnector):
 
             if cursor.description is None:
                 return []
-            return [dict(row) for row in cursor.fetchall()]
+            # RealDictRow is already a dict subclass; no per-row copy needed.
+            rows: list[dict[str, Any]] = cursor.fetchall()
+            return rows
         finally:
             cursor.close()
 
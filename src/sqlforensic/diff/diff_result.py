@@ -6,7 +6,7 @@ import hashlib
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnInfo:
     """Column metadata."""
 
@@ -245,9 +245,23 @@ class DiffResult:
         }
 
 
-def hash_body(body: str | None) -> str:
-    """Hash a SQL body for comparison."""
+def normalize_body(body: str | None) -> str:
+    """Collapse whitespace and lowercase a SQL body, as hashed by :func:`hash_body`."""
+    if not body:
+        return ""
+    # str.split() with no argument already drops leading/trailing whitespace
+    return " ".join(body.split()).lower()
+
+
+def hash_body(body: str | None, *, normalized: str | None = None) -> str:
+    """Hash a SQL body for comparison.
+
+    Args:
+        body: Raw SQL body.
+        normalized: ``normalize_body(body)`` if the caller already has it.
+    """
     if not body:
         return ""
-    normalized = " ".join(body.strip().split()).lower()
-    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+    if normalized is None:
+        normalized = normalize_body(body)
+    return hashlib.sha256(normalized.encode(), usedforsecurity=False).hexdigest()[:16]
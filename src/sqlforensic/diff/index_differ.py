@@ -2,29 +2,36 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from sqlforensic.diff.diff_result import IndexDiff, IndexInfo, IndexModification
 
 
+def _intern(value: Any) -> Any:
+    """Intern string identifiers so repeated names share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def _index_key(idx: dict[str, Any]) -> str:
     """Build a lookup key for an index."""
     schema = idx.get("table_schema", "")
     table = idx.get("table_name", "")
     name = idx.get("index_name", "")
-    return f"{schema}.{table}.{name}"
+    return sys.intern(f"{schema}.{table}.{name}")
 
 
 def _to_index_info(idx: dict[str, Any]) -> IndexInfo:
     """Convert raw index dict to IndexInfo."""
+    get = idx.get
     return IndexInfo(
-        table_schema=idx.get("table_schema", ""),
-        table_name=idx.get("table_name", ""),
-        index_name=idx.get("index_name", ""),
-        index_type=idx.get("index_type", ""),
-        is_unique=bool(idx.get("is_unique")),
-        is_primary_key=bool(idx.get("is_primary_key")),
-        columns=str(idx.get("columns", "")),
+        table_schema=_intern(get("table_schema", "")),
+        table_name=_intern(get("table_name", "")),
+        index_name=_intern(get("index_name", "")),
+        index_type=_intern(get("index_type", "")),
+        is_unique=bool(get("is_unique")),
+        is_primary_key=bool(get("is_primary_key")),
+        columns=str(get("columns", "")),
     )
 
 
@@ -41,24 +48,34 @@ def diff_indexes(
     Returns:
         IndexDiff with added, removed, and modified indexes.
     """
-    source_map = {_index_key(i): i for i in source_indexes}
-    target_map = {_index_key(i): i for i in target_indexes}
+    # dict(zip(map(...))) drives the iteration from C; _index_key still runs per index
+    source_map = dict(zip(map(_index_key, source_indexes), source_indexes))
+    target_map = dict(zip(map(_index_key, target_indexes), target_indexes))
+
+    # Classify keys in one pass over each map instead of building key sets.
+    added_keys: list[str] = []
+    common_keys: list[str] = []
+    for key in source_map:
+        (common_keys if key in target_map else added_keys).append(key)
+    removed_keys = [key for key in target_map if key not in source_map]
 
-    src_keys = set(source_map.keys())
-    tgt_keys = set(target_map.keys())
+    added_keys.sort()
+    removed_keys.sort()
+    common_keys.sort()
 
-    added = [_to_index_info(source_map[k]) for k in sorted(src_keys - tgt_keys)]
-    removed = [_to_index_info(target_map[k]) for k in sorted(tgt_keys - src_keys)]
+    added = [_to_index_info(source_map[k]) for k in added_keys]
+    removed = [_to_index_info(target_map[k]) for k in removed_keys]
 
     modified: list[IndexModification] = []
-    for key in sorted(src_keys & tgt_keys):
-        src_cols = str(source_map[key].get("columns", ""))
+    for key in common_keys:
+        src = source_map[key]
+        src_cols = str(src.get("columns", ""))
         tgt_cols = str(target_map[key].get("columns", ""))
         if src_cols != tgt_cols:
             modified.append(
                 IndexModification(
-                    table_name=source_map[key].get("table_name", ""),
-                    index_name=source_map[key].get("index_name", ""),
+                    table_name=src.get("table_name", ""),
+                    index_name=src.get("index_name", ""),
                     old_columns=tgt_cols,
                     new_columns=src_cols,
                 )
@@ -2,20 +2,84 @@
 
 from __future__ import annotations
 
+import functools
+import io
 import logging
+import sys
+from collections.abc import Callable
 from datetime import datetime, timezone
+from typing import IO
 
 from sqlforensic.diff.diff_result import (
     ColumnInfo,
+    ColumnModification,
     DiffResult,
+    ForeignKeyInfo,
+    ObjectDiff,
+    RiskAssessment,
+    TableInfo,
+    TableModification,
 )
 
 logger = logging.getLogger(__name__)
 
+_HEADER_TEMPLATE = (
+    "-- ============================================================\n"
+    "-- SQLForensic Migration Script\n"
+    "-- Generated: {now}\n"
+    "-- Provider:  {provider}\n"
+    "-- Source:    {source}\n"
+    "-- Target:    {target}\n"
+    "-- Safe mode: {safe_mode}\n"
+    "-- Risk level: {risk_level}\n"
+    "-- Total changes: {total_changes}\n"
+    "-- ============================================================\n"
+    "\n"
+)
+
+_FOOTER = (
+    "\n"
+    "-- ============================================================\n"
+    "-- End of migration script\n"
+    "-- ============================================================\n"
+)
+
+_BEGIN_PG = "BEGIN;\n\n"
+_END_PG = "\nCOMMIT;\n"
+
+_BEGIN_TSQL = "BEGIN TRY\n    BEGIN TRANSACTION;\n\n    PRINT 'Starting migration...';\n\n"
+_END_TSQL = (
+    "\n"
+    "    COMMIT TRANSACTION;\n"
+    "    PRINT 'Migration completed successfully.';\n"
+    "END TRY\n"
+    "BEGIN CATCH\n"
+    "    ROLLBACK TRANSACTION;\n"
+    "    PRINT 'Migration FAILED. Transaction rolled back. Error: '' + ERROR_MESSAGE()';\n"
+    "    THROW;\n"
+    "END CATCH\n"
+)
+
+_CREATE_TABLE_TEMPLATE = (
+    "IF NOT EXISTS (SELECT 1 FROM INFORMATION_SCHEMA.TABLES "
+    "WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table}')\n"
+    "BEGIN\n"
+    "    CREATE TABLE {full} (\n"
+    "{col_block}\n"
+    "    );\n"
+    "    {msg_kw} '{message}';\n"
+    "END\n"
+    "\n"
+)
 
+
+@functools.lru_cache(maxsize=4096)
 def _quote_identifier(name: str, provider: str = "sqlserver") -> str:
     """Quote an identifier for the given database provider.
 
+    Results are memoized since the same schema, table, and column names
+    are quoted many times over a single migration.
+
     Args:
         name: The identifier to quote.
         provider: Database provider ('sqlserver' or 'postgresql').
@@ -28,6 +92,7 @@ def _quote_identifier(name: str, provider: str = "sqlserver") -> str:
     return f"[{name}]"
 
 
+@functools.lru_cache(maxsize=4096)
 def _qualified_name(schema: str, name: str, provider: str = "sqlserver") -> str:
     """Build a fully qualified [schema].[name] identifier.
 
@@ -64,10 +129,24 @@ class MigrationGenerator:
         safe_mode: bool = True,
     ) -> None:
         self.diff = diff
-        self.provider = provider
+        self.provider = sys.intern(provider)
         self.safe_mode = safe_mode
-        self._lines: list[str] = []
+        # Resolve provider-specific syntax once instead of on every statement
+        self._is_pg = provider == "postgresql"
+        self._qo, self._qc = ('"', '"') if self._is_pg else ("[", "]")
+        self._msg_kw = "RAISE NOTICE" if self._is_pg else "PRINT"
+        self._max_suffix = "(MAX)" if provider == "sqlserver" else ""
+        self._begin_block, self._end_block = (
+            (_BEGIN_PG, _END_PG) if self._is_pg else (_BEGIN_TSQL, _END_TSQL)
+        )
+        self._alter_column: Callable[[str, str, ColumnModification], None] = (
+            self._alter_column_pg if self._is_pg else self._alter_column_tsql
+        )
+        self._out: IO[str] = io.StringIO()
+        self._line_count = 0
         self._step = 0
+        self._risks_by_table: dict[str, list[RiskAssessment]] = {}
+        self._risks_by_column: dict[tuple[str, str], list[RiskAssessment]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -92,48 +171,72 @@ class MigrationGenerator:
         Returns:
             Complete migration SQL script as a string.
         """
+        buf = io.StringIO()
+        self.generate_to(buf)
+        return buf.getvalue()
+
+    def generate_to(self, fp: IO[str]) -> int:
+        """Write the migration SQL script directly to an open text stream.
+
+        Produces the same script as :meth:`generate` without holding the
+        whole script in memory, which matters for very large diffs.
+
+        Args:
+            fp: Writable text stream, e.g. a file opened in ``"w"`` mode.
+
+        Returns:
+            Number of lines written.
+        """
         logger.info(
             "Generating migration script (provider=%s, safe_mode=%s)",
             self.provider,
             self.safe_mode,
         )
 
-        self._lines = []
+        self._out = fp
+        self._line_count = 0
         self._step = 0
+        self._index_risks()
+
+        # Dereference the diff once; each step receives only what it needs
+        diff = self.diff
+        tables = diff.tables
+        add_cols, mod_cols, add_cons, drop_cons, drop_cols = self._partition_modified_tables(
+            tables.modified_tables
+        )
 
         self._emit_header()
         self._begin_transaction()
 
         # Step 1 — Create new tables
-        self._step_create_tables()
+        self._step_create_tables(tables.added_tables)
 
         # Step 2 — Add new columns
-        self._step_add_columns()
+        self._step_add_columns(add_cols)
 
         # Step 3 — Modify columns
-        self._step_modify_columns()
+        self._step_modify_columns(mod_cols)
 
         # Step 4 — Add constraints and foreign keys
-        self._step_add_constraints()
+        self._step_add_constraints(diff.foreign_keys_added, add_cons)
 
         # Step 5 — SPs, views, and functions (comments only)
-        self._step_programmable_objects()
+        self._step_programmable_objects(diff.procedures, diff.views, diff.functions)
 
         # Step 6 — Drop removed constraints / foreign keys
-        self._step_drop_constraints()
+        self._step_drop_constraints(diff.foreign_keys_removed, drop_cons)
 
         # Step 7 — Drop removed columns
-        self._step_drop_columns()
+        self._step_drop_columns(drop_cols)
 
         # Step 8 — Drop removed tables
-        self._step_drop_tables()
+        self._step_drop_tables(tables.removed_tables)
 
         self._end_transaction()
         self._emit_footer()
 
-        script = "\n".join(self._lines)
-        logger.info("Migration script generated (%d lines)", len(self._lines))
-        return script
+        logger.info("Migration script generated (%d lines)", self._line_count)
+        return self._line_count
 
     # ------------------------------------------------------------------
     # Header / footer
@@ -142,21 +245,22 @@ class MigrationGenerator:
     def _emit_header(self) -> None:
         """Emit the script header with metadata."""
         now = datetime.now(tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-        self._w("-- ============================================================")
-        self._w("-- SQLForensic Migration Script")
-        self._w(f"-- Generated: {now}")
-        self._w(f"-- Provider:  {self.provider}")
-        self._w(f"-- Source:    {self.diff.source_server}/{self.diff.source_database}")
-        self._w(f"-- Target:    {self.diff.target_server}/{self.diff.target_database}")
-        self._w(f"-- Safe mode: {'ON' if self.safe_mode else 'OFF'}")
-        self._w(f"-- Risk level: {self.diff.risk_level}")
-        self._w(f"-- Total changes: {self.diff.total_changes}")
-        self._w("-- ============================================================")
-        self._w("")
+        diff = self.diff
+        self._write_block(
+            _HEADER_TEMPLATE.format(
+                now=now,
+                provider=self.provider,
+                source=f"{diff.source_server}/{diff.source_database}",
+                target=f"{diff.target_server}/{diff.target_database}",
+                safe_mode="ON" if self.safe_mode else "OFF",
+                risk_level=diff.risk_level,
+                total_changes=diff.total_changes,
+            )
+        )
 
-        if self.diff.risks:
+        if diff.risks:
             self._w("-- RISK SUMMARY:")
-            for risk in self.diff.risks:
+            for risk in diff.risks:
                 if risk.risk_level in ("HIGH", "CRITICAL"):
                     self._w(f"--   [{risk.risk_level}] {risk.change_description}")
                     for bc in risk.breaking_changes:
@@ -165,10 +269,7 @@ class MigrationGenerator:
 
     def _emit_footer(self) -> None:
         """Emit the script footer."""
-        self._w("")
-        self._w("-- ============================================================")
-        self._w("-- End of migration script")
-        self._w("-- ============================================================")
+        self._write_block(_FOOTER)
 
     # ------------------------------------------------------------------
     # Transaction wrapper
@@ -176,189 +277,197 @@ class MigrationGenerator:
 
     def _begin_transaction(self) -> None:
         """Emit transaction start with error handling."""
-        if self.provider == "postgresql":
-            self._w("BEGIN;")
-            self._w("")
-        else:
-            self._w("BEGIN TRY")
-            self._w("    BEGIN TRANSACTION;")
-            self._w("")
-            self._print_msg("Starting migration...")
-            self._w("")
+        self._write_block(self._begin_block)
 
     def _end_transaction(self) -> None:
         """Emit transaction commit / rollback."""
-        self._w("")
-        if self.provider == "postgresql":
-            self._w("COMMIT;")
-        else:
-            self._w("    COMMIT TRANSACTION;")
-            self._print_msg("Migration completed successfully.")
-            self._w("END TRY")
-            self._w("BEGIN CATCH")
-            self._w("    ROLLBACK TRANSACTION;")
-            self._print_msg("Migration FAILED. Transaction rolled back. Error: ' + ERROR_MESSAGE()")
-            self._w("    THROW;")
-            self._w("END CATCH")
+        self._write_block(self._end_block)
 
     # ------------------------------------------------------------------
     # Step 1 — Create new tables
     # ------------------------------------------------------------------
 
-    def _step_create_tables(self) -> None:
+    def _step_create_tables(self, tables: list[TableInfo]) -> None:
         """Generate CREATE TABLE statements for added tables."""
-        tables = self.diff.tables.added_tables
         if not tables:
             return
 
         self._next_step("Create new tables")
+        qo, qc = self._qo, self._qc
         for table in tables:
             self._emit_risk_warnings(table.name)
             full = _qualified_name(table.schema or "dbo", table.name, self.provider)
-            self._w(
-                f"IF NOT EXISTS (SELECT 1 FROM INFORMATION_SCHEMA.TABLES "
-                f"WHERE TABLE_SCHEMA = '{table.schema or 'dbo'}' "
-                f"AND TABLE_NAME = '{table.name}')"
-            )
-            self._w("BEGIN")
-            self._w(f"    CREATE TABLE {full} (")
             col_defs: list[str] = []
-            pk_cols: list[str] = []
+            pk_parts: list[str] = []
             for col in table.columns:
                 col_defs.append(f"        {self._column_definition(col)}")
                 if col.is_primary_key:
-                    pk_cols.append(col.name)
-            if pk_cols:
-                pk_list = ", ".join(_quote_identifier(c, self.provider) for c in pk_cols)
+                    pk_parts.append(f"{qo}{col.name}{qc}")
+            if pk_parts:
+                pk_list = ", ".join(pk_parts)
                 col_defs.append(f"        CONSTRAINT PK_{table.name} PRIMARY KEY ({pk_list})")
-            self._w(",\n".join(col_defs))
-            self._w("    );")
-            self._print_msg(f"Created table {full}")
-            self._w("END")
-            self._w("")
+            self._write_block(
+                _CREATE_TABLE_TEMPLATE.format_map(
+                    {
+                        "schema": table.schema or "dbo",
+                        "table": table.name,
+                        "full": full,
+                        "col_block": ",\n".join(col_defs),
+                        "msg_kw": self._msg_kw,
+                        "message": self._escape_sql(f"Created table {full}"),
+                    }
+                )
+            )
 
     # ------------------------------------------------------------------
     # Step 2 — Add new columns
     # ------------------------------------------------------------------
 
-    def _step_add_columns(self) -> None:
+    def _step_add_columns(self, mods_with_adds: list[TableModification]) -> None:
         """Generate ALTER TABLE ADD COLUMN for new columns."""
-        mods_with_adds = [m for m in self.diff.tables.modified_tables if m.added_columns]
         if not mods_with_adds:
             return
 
         self._next_step("Add new columns")
+        qo, qc, msg_kw, max_suffix = self._qo, self._qc, self._msg_kw, self._max_suffix
+        escape = self._escape_sql
         for mod in mods_with_adds:
-            full = _qualified_name(mod.table_schema or "dbo", mod.table_name, self.provider)
+            sch = mod.table_schema or "dbo"
+            tbl = mod.table_name
+            full = _qualified_name(sch, tbl, self.provider)
             for col in mod.added_columns:
-                col_q = _quote_identifier(col.name, self.provider)
-                self._w(
+                name = col.name
+                dtype = col.data_type
+                if col.max_length and col.max_length > 0:
+                    dtype = (
+                        f"{dtype}{max_suffix}"
+                        if col.max_length == -1
+                        else f"{dtype}({col.max_length})"
+                    )
+                null_spec = " NULL" if col.is_nullable else " NOT NULL"
+                default_spec = f" DEFAULT {col.default}" if col.default else ""
+                message = escape(f"Added column {name} to {full}")
+                self._write_block(
                     f"IF NOT EXISTS (SELECT 1 FROM INFORMATION_SCHEMA.COLUMNS "
-                    f"WHERE TABLE_SCHEMA = '{mod.table_schema or 'dbo'}' "
-                    f"AND TABLE_NAME = '{mod.table_name}' "
-                    f"AND COLUMN_NAME = '{col.name}')"
-                )
-                self._w("BEGIN")
-                self._w(
-                    f"    ALTER TABLE {full} ADD {col_q} "
-                    f"{self._type_spec(col)}{self._null_spec(col)}{self._default_spec(col)};"
+                    f"WHERE TABLE_SCHEMA = '{sch}' "
+                    f"AND TABLE_NAME = '{tbl}' "
+                    f"AND COLUMN_NAME = '{name}')\n"
+                    f"BEGIN\n"
+                    f"    ALTER TABLE {full} ADD {qo}{name}{qc} {dtype}{null_spec}{default_spec};\n"
+                    f"    {msg_kw} '{message}';\n"
+                    f"END\n"
+                    f"\n"
                 )
-                self._print_msg(f"Added column {col.name} to {full}")
-                self._w("END")
-                self._w("")
 
     # ------------------------------------------------------------------
     # Step 3 — Modify columns
     # ------------------------------------------------------------------
 
-    def _step_modify_columns(self) -> None:
+    def _step_modify_columns(self, mods_with_changes: list[TableModification]) -> None:
         """Generate ALTER COLUMN for type, nullability, and length changes."""
-        mods_with_changes = [m for m in self.diff.tables.modified_tables if m.modified_columns]
         if not mods_with_changes:
             return
 
-        self._next_step("Modify existing columns")
-        for mod in mods_with_changes:
-            full = _qualified_name(mod.table_schema or "dbo", mod.table_name, self.provider)
-            for col_mod in mod.modified_columns:
-                self._emit_risk_warnings(mod.table_name, col_mod.column_name)
-                if col_mod.is_breaking:
-                    self._w(
-                        f"-- WARNING: Breaking change on {mod.table_name}.{col_mod.column_name}"
-                    )
-                    self._w(
-                        f"--   {col_mod.change_type}: {col_mod.old_value} -> {col_mod.new_value}"
-                    )
-
-                col_q = _quote_identifier(col_mod.column_name, self.provider)
-
-                if col_mod.change_type in ("type_change", "length_change"):
-                    new_type = col_mod.new_value
-                    if col_mod.change_type == "length_change":
-                        # For length changes, we need to rebuild the type spec
-                        # new_value holds the new length
-                        new_type = f"({col_mod.new_value})"
-                        self._w(
-                            f"-- NOTE: Adjust the type below to match the full "
-                            f"data type with new length {col_mod.new_value}"
-                        )
-
-                    if self.provider == "postgresql":
-                        self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} TYPE {new_type};")
-                    else:
-                        self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} {new_type};")
-
-                elif col_mod.change_type == "nullability_change":
-                    null_kw = "NULL" if col_mod.new_value == "YES" else "NOT NULL"
-                    if self.provider == "postgresql":
-                        if null_kw == "NOT NULL":
-                            self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} SET NOT NULL;")
-                        else:
-                            self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} DROP NOT NULL;")
-                    else:
-                        # SQL Server needs the full type re-specified; flag it
+        # Unrecognised change types emit nothing, so render into a local buffer
+        # and drop the step entirely if it ends up with no content.
+        out, line_count = self._out, self._line_count
+        self._out = body = io.StringIO()
+        try:
+            alter_column = self._alter_column
+            for mod in mods_with_changes:
+                full = _qualified_name(mod.table_schema or "dbo", mod.table_name, self.provider)
+                for col_mod in mod.modified_columns:
+                    self._emit_risk_warnings(mod.table_name, col_mod.column_name)
+                    if col_mod.is_breaking:
                         self._w(
-                            "-- NOTE: SQL Server ALTER COLUMN requires the full "
-                            "data type. Adjust as needed."
+                            f"-- WARNING: Breaking change on {mod.table_name}.{col_mod.column_name}"
                         )
                         self._w(
-                            f"ALTER TABLE {full} ALTER COLUMN {col_q} /* <data_type> */ {null_kw};"
+                            f"--   {col_mod.change_type}: "
+                            f"{col_mod.old_value} -> {col_mod.new_value}"
                         )
 
-                elif col_mod.change_type == "default_change":
-                    if self.provider == "postgresql":
-                        if col_mod.new_value:
-                            self._w(
-                                f"ALTER TABLE {full} ALTER COLUMN {col_q} "
-                                f"SET DEFAULT {col_mod.new_value};"
-                            )
-                        else:
-                            self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} DROP DEFAULT;")
-                    else:
-                        # SQL Server default handling via constraints
-                        self._w(
-                            "-- NOTE: SQL Server defaults are managed via "
-                            "constraints. Manual review may be required."
-                        )
-                        if col_mod.new_value:
-                            df_name = f"DF_{mod.table_name}_{col_mod.column_name}"
-                            self._w(
-                                f"ALTER TABLE {full} ADD CONSTRAINT "
-                                f"{_quote_identifier(df_name, self.provider)} "
-                                f"DEFAULT {col_mod.new_value} FOR {col_q};"
-                            )
-                        else:
-                            self._w(f"-- Drop existing default constraint on {col_q} manually")
-                self._w("")
+                    alter_column(full, mod.table_name, col_mod)
+                    self._w("")
+        finally:
+            self._out = out
+
+        text = body.getvalue()
+        if not text.strip():
+            self._line_count = line_count
+            return
+        self._next_step("Modify existing columns")
+        out.write(text)
+
+    def _alter_column_pg(self, full: str, table_name: str, col_mod: ColumnModification) -> None:
+        """Emit the PostgreSQL ALTER COLUMN statement(s) for one column change."""
+        col_q = self._q(col_mod.column_name)
+        change_type = col_mod.change_type
+        if change_type == "type_change":
+            self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} TYPE {col_mod.new_value};")
+        elif change_type == "length_change":
+            # new_value holds only the new length; the full type must be rebuilt
+            self._w(
+                f"-- NOTE: Adjust the type below to match the full "
+                f"data type with new length {col_mod.new_value}"
+            )
+            self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} TYPE ({col_mod.new_value});")
+        elif change_type == "nullability_change":
+            if col_mod.new_value == "YES":
+                self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} DROP NOT NULL;")
+            else:
+                self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} SET NOT NULL;")
+        elif change_type == "default_change":
+            if col_mod.new_value:
+                self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} SET DEFAULT {col_mod.new_value};")
+            else:
+                self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} DROP DEFAULT;")
+
+    def _alter_column_tsql(self, full: str, table_name: str, col_mod: ColumnModification) -> None:
+        """Emit the SQL Server ALTER COLUMN statement(s) for one column change."""
+        col_q = self._q(col_mod.column_name)
+        change_type = col_mod.change_type
+        if change_type == "type_change":
+            self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} {col_mod.new_value};")
+        elif change_type == "length_change":
+            # new_value holds only the new length; the full type must be rebuilt
+            self._w(
+                f"-- NOTE: Adjust the type below to match the full "
+                f"data type with new length {col_mod.new_value}"
+            )
+            self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} ({col_mod.new_value});")
+        elif change_type == "nullability_change":
+            null_kw = "NULL" if col_mod.new_value == "YES" else "NOT NULL"
+            # SQL Server needs the full type re-specified; flag it
+            self._w(
+                "-- NOTE: SQL Server ALTER COLUMN requires the full data type. Adjust as needed."
+            )
+            self._w(f"ALTER TABLE {full} ALTER COLUMN {col_q} /* <data_type> */ {null_kw};")
+        elif change_type == "default_change":
+            # SQL Server default handling via constraints
+            self._w(
+                "-- NOTE: SQL Server defaults are managed via "
+                "constraints. Manual review may be required."
+            )
+            if col_mod.new_value:
+                df_name = f"DF_{table_name}_{col_mod.column_name}"
+                self._w(
+                    f"ALTER TABLE {full} ADD CONSTRAINT {self._q(df_name)} "
+                    f"DEFAULT {col_mod.new_value} FOR {col_q};"
+                )
+            else:
+                self._w(f"-- Drop existing default constraint on {col_q} manually")
 
     # ------------------------------------------------------------------
     # Step 4 — Add constraints / foreign keys
     # ------------------------------------------------------------------
 
-    def _step_add_constraints(self) -> None:
+    def _step_add_constraints(
+        self,
+        added_fks: list[ForeignKeyInfo],
+        mods_with_constraints: list[TableModification],
+    ) -> None:
         """Generate ADD CONSTRAINT for new constraints and foreign keys."""
-        added_fks = self.diff.foreign_keys_added
-        mods_with_constraints = [m for m in self.diff.tables.modified_tables if m.added_constraints]
         if not added_fks and not mods_with_constraints:
             return
 
@@ -368,10 +477,10 @@ class MigrationGenerator:
         for mod in mods_with_constraints:
             full = _qualified_name(mod.table_schema or "dbo", mod.table_name, self.provider)
             for cons in mod.added_constraints:
-                col_list = ", ".join(_quote_identifier(c, self.provider) for c in cons.columns)
+                col_list = ", ".join(self._q(c) for c in cons.columns)
                 self._w(
                     f"ALTER TABLE {full} ADD CONSTRAINT "
-                    f"{_quote_identifier(cons.name, self.provider)} "
+                    f"{self._q(cons.name)} "
                     f"{cons.constraint_type} ({col_list});"
                 )
                 self._print_msg(f"Added constraint {cons.name} on {mod.table_name}")
@@ -385,8 +494,8 @@ class MigrationGenerator:
                 fk.referenced_table,
                 self.provider,
             )
-            parent_col = _quote_identifier(fk.parent_column, self.provider)
-            ref_col = _quote_identifier(fk.referenced_column, self.provider)
+            parent_col = self._q(fk.parent_column)
+            ref_col = self._q(fk.referenced_column)
             fk_name = fk.constraint_name or (
                 f"FK_{fk.parent_table}_{fk.parent_column}_"
                 f"{fk.referenced_table}_{fk.referenced_column}"
@@ -398,7 +507,7 @@ class MigrationGenerator:
             self._w("BEGIN")
             self._w(
                 f"    ALTER TABLE {parent_full} ADD CONSTRAINT "
-                f"{_quote_identifier(fk_name, self.provider)} "
+                f"{self._q(fk_name)} "
                 f"FOREIGN KEY ({parent_col}) "
                 f"REFERENCES {ref_full} ({ref_col});"
             )
@@ -414,12 +523,10 @@ class MigrationGenerator:
     # Step 5 — Programmable objects (SPs, views, functions)
     # ------------------------------------------------------------------
 
-    def _step_programmable_objects(self) -> None:
+    def _step_programmable_objects(
+        self, procs: ObjectDiff, views: ObjectDiff, funcs: ObjectDiff
+    ) -> None:
         """Flag SP, view, and function changes as comments for manual action."""
-        procs = self.diff.procedures
-        views = self.diff.views
-        funcs = self.diff.functions
-
         has_changes = (
             procs.added
             or procs.removed
@@ -439,51 +546,46 @@ class MigrationGenerator:
         self._w("-- manual review. Their bodies are not included in this script.")
         self._w("")
 
-        for label, obj_diff, type_name in [
-            ("Stored Procedures", procs, "PROCEDURE"),
-            ("Views", views, "VIEW"),
-            ("Functions", funcs, "FUNCTION"),
-        ]:
-            if obj_diff.added:
-                self._w(f"-- New {label}:")
-                for obj in obj_diff.added:
-                    name = _qualified_name(
-                        obj.get("schema", "dbo"),
-                        obj.get("name", ""),
-                        self.provider,
-                    )
-                    self._w(f"--   CREATE {type_name} {name}  -- TODO: add definition")
-                self._w("")
+        self._emit_object_section("Stored Procedures", procs, "PROCEDURE")
+        self._emit_object_section("Views", views, "VIEW")
+        self._emit_object_section("Functions", funcs, "FUNCTION")
+
+    def _emit_object_section(self, label: str, obj_diff: ObjectDiff, type_name: str) -> None:
+        """Emit the added/removed/modified comment blocks for one object type."""
+        if obj_diff.added:
+            self._w(f"-- New {label}:")
+            for obj in obj_diff.added:
+                name = _qualified_name(obj.get("schema", "dbo"), obj.get("name", ""), self.provider)
+                self._w(f"--   CREATE {type_name} {name}  -- TODO: add definition")
+            self._w("")
 
-            if obj_diff.removed:
-                self._w(f"-- Removed {label}:")
-                for obj in obj_diff.removed:
-                    name = _qualified_name(
-                        obj.get("schema", "dbo"),
-                        obj.get("name", ""),
-                        self.provider,
-                    )
-                    self._w(f"--   DROP {type_name} {name}  -- TODO: verify before dropping")
-                self._w("")
+        if obj_diff.removed:
+            self._w(f"-- Removed {label}:")
+            for obj in obj_diff.removed:
+                name = _qualified_name(obj.get("schema", "dbo"), obj.get("name", ""), self.provider)
+                self._w(f"--   DROP {type_name} {name}  -- TODO: verify before dropping")
+            self._w("")
 
-            if obj_diff.modified:
-                self._w(f"-- Modified {label}:")
-                for mod_obj in obj_diff.modified:
-                    name = _qualified_name(mod_obj.schema or "dbo", mod_obj.name, self.provider)
-                    self._w(
-                        f"--   ALTER {type_name} {name}  "
-                        f"-- hash changed: {mod_obj.source_hash} -> {mod_obj.target_hash}"
-                    )
-                self._w("")
+        if obj_diff.modified:
+            self._w(f"-- Modified {label}:")
+            for mod_obj in obj_diff.modified:
+                name = _qualified_name(mod_obj.schema or "dbo", mod_obj.name, self.provider)
+                self._w(
+                    f"--   ALTER {type_name} {name}  "
+                    f"-- hash changed: {mod_obj.source_hash} -> {mod_obj.target_hash}"
+                )
+            self._w("")
 
     # ------------------------------------------------------------------
     # Step 6 — Drop removed constraints / foreign keys
     # ------------------------------------------------------------------
 
-    def _step_drop_constraints(self) -> None:
+    def _step_drop_constraints(
+        self,
+        removed_fks: list[ForeignKeyInfo],
+        mods_with_drops: list[TableModification],
+    ) -> None:
         """Generate DROP CONSTRAINT for removed FKs and constraints."""
-        removed_fks = self.diff.foreign_keys_removed
-        mods_with_drops = [m for m in self.diff.tables.modified_tables if m.removed_constraints]
         if not removed_fks and not mods_with_drops:
             return
 
@@ -493,10 +595,7 @@ class MigrationGenerator:
         for mod in mods_with_drops:
             full = _qualified_name(mod.table_schema or "dbo", mod.table_name, self.provider)
             for cons in mod.removed_constraints:
-                self._w(
-                    f"ALTER TABLE {full} DROP CONSTRAINT "
-                    f"IF EXISTS {_quote_identifier(cons.name, self.provider)};"
-                )
+                self._w(f"ALTER TABLE {full} DROP CONSTRAINT IF EXISTS {self._q(cons.name)};")
                 self._print_msg(f"Dropped constraint {cons.name} from {mod.table_name}")
                 self._w("")
 
@@ -508,10 +607,7 @@ class MigrationGenerator:
                 f"FK_{fk.parent_table}_{fk.parent_column}_"
                 f"{fk.referenced_table}_{fk.referenced_column}"
             )
-            self._w(
-                f"ALTER TABLE {parent_full} DROP CONSTRAINT "
-                f"IF EXISTS {_quote_identifier(fk_name, self.provider)};"
-            )
+            self._w(f"ALTER TABLE {parent_full} DROP CONSTRAINT IF EXISTS {self._q(fk_name)};")
             self._print_msg(
                 f"Dropped foreign key {fk_name} "
                 f"({fk.parent_table}.{fk.parent_column} -> "
@@ -523,13 +619,12 @@ class MigrationGenerator:
     # Step 7 — Drop removed columns
     # ------------------------------------------------------------------
 
-    def _step_drop_columns(self) -> None:
+    def _step_drop_columns(self, mods_with_drops: list[TableModification]) -> None:
         """Generate ALTER TABLE DROP COLUMN for removed columns.
 
         In safe_mode, these statements are commented out with a
         MANUAL REVIEW REQUIRED warning.
         """
-        mods_with_drops = [m for m in self.diff.tables.modified_tables if m.removed_columns]
         if not mods_with_drops:
             return
 
@@ -544,7 +639,7 @@ class MigrationGenerator:
             full = _qualified_name(mod.table_schema or "dbo", mod.table_name, self.provider)
             for col in mod.removed_columns:
                 self._emit_risk_warnings(mod.table_name, col.name)
-                col_q = _quote_identifier(col.name, self.provider)
+                col_q = self._q(col.name)
                 stmt = f"ALTER TABLE {full} DROP COLUMN {col_q};"
                 if self.safe_mode:
                     self._w(f"-- {stmt}")
@@ -557,13 +652,12 @@ class MigrationGenerator:
     # Step 8 — Drop removed tables
     # ------------------------------------------------------------------
 
-    def _step_drop_tables(self) -> None:
+    def _step_drop_tables(self, tables: list[TableInfo]) -> None:
         """Generate DROP TABLE for removed tables.
 
         In safe_mode, these statements are commented out with a
         MANUAL REVIEW REQUIRED warning.
         """
-        tables = self.diff.tables.removed_tables
         if not tables:
             return
 
@@ -598,63 +692,114 @@ class MigrationGenerator:
         self._w("")
 
     def _w(self, line: str) -> None:
-        """Append a line to the script output."""
-        self._lines.append(line)
+        """Write a line to the script output."""
+        out = self._out
+        out.write(line)
+        out.write("\n")
+        self._line_count += 1
+
+    def _write_block(self, block: str) -> None:
+        """Write a pre-assembled, newline-terminated block of lines."""
+        self._out.write(block)
+        self._line_count += block.count("\n")
+
+    def _q(self, name: str) -> str:
+        """Quote an identifier for this generator's provider."""
+        return f"{self._qo}{name}{self._qc}"
 
     def _print_msg(self, message: str) -> None:
         """Emit a provider-appropriate print/notice statement.
 
         Uses PRINT for SQL Server and RAISE NOTICE for PostgreSQL.
         """
-        if self.provider == "postgresql":
-            self._w(f"    RAISE NOTICE '{self._escape_sql(message)}';")
-        else:
-            self._w(f"    PRINT '{self._escape_sql(message)}';")
+        self._w(f"    {self._msg_kw} '{self._escape_sql(message)}';")
 
     def _column_definition(self, col: ColumnInfo) -> str:
         """Build a column definition clause for CREATE TABLE."""
-        parts = [_quote_identifier(col.name, self.provider)]
-        parts.append(self._type_spec(col))
-        parts.append("NULL" if col.is_nullable else "NOT NULL")
-        if col.default:
-            parts.append(f"DEFAULT {col.default}")
-        return " ".join(parts)
+        null_spec = " NULL" if col.is_nullable else " NOT NULL"
+        default_spec = f" DEFAULT {col.default}" if col.default else ""
+        return f"{self._qo}{col.name}{self._qc} {self._type_spec(col)}{null_spec}{default_spec}"
 
     def _type_spec(self, col: ColumnInfo) -> str:
         """Build the data type specification for a column."""
         dtype = col.data_type
         if col.max_length and col.max_length > 0:
             if col.max_length == -1:
-                dtype = f"{dtype}(MAX)" if self.provider == "sqlserver" else f"{dtype}"
+                dtype = f"{dtype}{self._max_suffix}"
             else:
                 dtype = f"{dtype}({col.max_length})"
         return dtype
 
-    def _null_spec(self, col: ColumnInfo) -> str:
-        """Return the NULL/NOT NULL specification for a column."""
-        return " NULL" if col.is_nullable else " NOT NULL"
+    @staticmethod
+    def _partition_modified_tables(
+        modified_tables: list[TableModification],
+    ) -> tuple[
+        list[TableModification],
+        list[TableModification],
+        list[TableModification],
+        list[TableModification],
+        list[TableModification],
+    ]:
+        """Split modified tables by change kind in one pass for the step methods.
+
+        Returns:
+            Tables with added columns, modified columns, added constraints,
+            removed constraints, and removed columns, in that order.
+        """
+        add_cols: list[TableModification] = []
+        mod_cols: list[TableModification] = []
+        add_cons: list[TableModification] = []
+        drop_cons: list[TableModification] = []
+        drop_cols: list[TableModification] = []
+        for mod in modified_tables:
+            if mod.added_columns:
+                add_cols.append(mod)
+            if mod.modified_columns:
+                mod_cols.append(mod)
+            if mod.added_constraints:
+                add_cons.append(mod)
+            if mod.removed_constraints:
+                drop_cons.append(mod)
+            if mod.removed_columns:
+                drop_cols.append(mod)
+        return add_cols, mod_cols, add_cons, drop_cons, drop_cols
+
+    def _index_risks(self) -> None:
+        """Group HIGH/CRITICAL risks by table so warnings are looked up, not scanned."""
+        by_table: dict[str, list[RiskAssessment]] = {}
+        for risk in self.diff.risks:
+            if risk.risk_level in ("HIGH", "CRITICAL"):
+                by_table.setdefault(risk.table, []).append(risk)
+        self._risks_by_table = by_table
+        self._risks_by_column = {}
+
+    def _risks_for(self, table_name: str, column_name: str | None = None) -> list[RiskAssessment]:
+        """Return the HIGH/CRITICAL risks for a table, optionally narrowed to a column.
 
-    def _default_spec(self, col: ColumnInfo) -> str:
-        """Return the DEFAULT specification for a column, if any."""
-        if col.default:
-            return f" DEFAULT {col.default}"
-        return ""
+        Column matches are resolved once per (table, column) pair and cached,
+        so each risk description is scanned at most once per column.
+        """
+        table_risks = self._risks_by_table.get(table_name)
+        if not table_risks or not column_name:
+            return table_risks or []
+        key = (table_name, column_name)
+        column_risks = self._risks_by_column.get(key)
+        if column_risks is None:
+            column_risks = [r for r in table_risks if column_name in r.change_description]
+            self._risks_by_column[key] = column_risks
+        return column_risks
 
     def _emit_risk_warnings(self, table_name: str, column_name: str | None = None) -> None:
         """Emit SQL comments for any matching risk assessments."""
-        for risk in self.diff.risks:
-            if risk.table != table_name:
-                continue
-            if column_name and column_name not in risk.change_description:
-                continue
-            if risk.risk_level in ("HIGH", "CRITICAL"):
-                self._w(f"-- RISK [{risk.risk_level}]: {risk.change_description}")
-                for bc in risk.breaking_changes:
-                    self._w(f"--   Breaking: {bc}")
-                for rec in risk.recommendations:
-                    self._w(f"--   Recommendation: {rec}")
+        for risk in self._risks_for(table_name, column_name):
+            self._w(f"-- RISK [{risk.risk_level}]: {risk.change_description}")
+            for bc in risk.breaking_changes:
+                self._w(f"--   Breaking: {bc}")
+            for rec in risk.recommendations:
+                self._w(f"--   Recommendation: {rec}")
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _escape_sql(text: str) -> str:
-        """Escape single quotes in SQL string literals."""
+        """Escape single quotes in SQL string literals (memoized per text)."""
         return text.replace("'", "''")
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import re
+from dataclasses import dataclass, field
 from typing import Any
 
 from sqlforensic.diff.diff_result import (
@@ -11,6 +14,79 @@ from sqlforensic.diff.diff_result import (
     TableModification,
 )
 
+# For identifiers made only of word characters, a \b-delimited match is
+# exactly one whole \w+ run of the body, so tokenizing bodies on \w+ lets
+# lookups go through an inverted index instead of rescanning every body.
+_WORD_RE = re.compile(r"\w+")
+
+
+# Lower bounds of each risk level above NONE; bisect_right maps a score to its level
+_LEVEL_THRESHOLDS = (0.05, 0.2, 0.4, 0.7)
+_LEVELS = ("NONE", "LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+
+# Compiled whole-word patterns for names that can't use the substring fast
+# path; re's own cache is small and shared, so keep a bounded one of our own.
+@functools.lru_cache(maxsize=4096)
+def _word_pattern(name: str, flags: int = 0) -> re.Pattern[str]:
+    """Return the compiled ``\\b<name>\\b`` pattern for ``name``."""
+    return re.compile(rf"\b{re.escape(name)}\b", flags)
+
+
+def _is_word_char(ch: str) -> bool:
+    """Return True if ``ch`` is a regex word character (alphanumeric or underscore)."""
+    return ch.isalnum() or ch == "_"
+
+
+def _fold(body: str) -> str:
+    """Lowercase an ASCII body; leave anything else as-is for IGNORECASE matching.
+
+    ``str.lower()`` and the ``re`` module's case-insensitive matching only
+    agree on ASCII (e.g. U+0130 lowers to two code points), so non-ASCII
+    bodies are kept verbatim. ``str.isascii()`` is O(1), which makes the
+    folded/unfolded state cheap to recover later.
+    """
+    return body.lower() if body.isascii() else body
+
+
+def _mentions(text: str, name: str) -> bool:
+    r"""Case-insensitive whole-word search for ``name`` in a :func:`_fold`-ed body.
+
+    Equivalent to ``re.search(rf"\b{re.escape(name)}\b", body, re.IGNORECASE)``
+    on the original body. When body and name are both ASCII, both sides are
+    lowercased, so no case folding is needed while matching. For names that
+    start and end with a word character, ``\b`` then reduces to "not
+    preceded or followed by a word character", so ``str.find`` plus a
+    neighbour check does the job without a regex.
+    """
+    if not (text.isascii() and name.isascii()):
+        return _word_pattern(name, re.IGNORECASE).search(text) is not None
+    needle = name.lower()
+    if not name or not (_is_word_char(name[0]) and _is_word_char(name[-1])):
+        return _word_pattern(needle).search(text) is not None
+    size = len(needle)
+    end_of_body = len(text)
+    start = text.find(needle)
+    while start != -1:
+        end = start + size
+        if (start == 0 or not _is_word_char(text[start - 1])) and (
+            end == end_of_body or not _is_word_char(text[end])
+        ):
+            return True
+        start = text.find(needle, start + 1)
+    return False
+
+
+@dataclass(slots=True)
+class _BodyTokens:
+    """Word tokens of a list of :func:`_fold`-ed bodies, indexed both ways."""
+
+    # Lowercased token -> positions of the folded bodies containing it
+    postings: dict[str, list[int]] = field(default_factory=dict)
+    # Per-body token set; None for bodies left unfolded (non-ASCII)
+    tokens: list[frozenset[str] | None] = field(default_factory=list)
+    unfolded: list[int] = field(default_factory=list)
+
 
 class RiskAssessor:
     """Assess risk of schema changes using dependency graph data.
@@ -28,6 +104,13 @@ class RiskAssessor:
         self.stored_procedures = stored_procedures
         self.foreign_keys = foreign_keys
         self.views = views
+        # Word tokens of the _sp_items/_view_items bodies, built on first use
+        self._sp_tokens: _BodyTokens | None = None
+        self._view_tokens = _BodyTokens()
+        # Identifier -> (SP positions, view positions) of bodies mentioning it
+        self._ref_cache: dict[str, tuple[list[int], list[int]]] = {}
+        # Lookup results keyed by (kind, *names); bodies never change per instance
+        self._dep_cache: dict[tuple[str, ...], list[str]] = {}
 
     def assess(self, diff: DiffResult) -> list[RiskAssessment]:
         """Assess all changes in a DiffResult.
@@ -138,6 +221,9 @@ class RiskAssessor:
         """Assess risk for all changes within a single table modification."""
         risks: list[RiskAssessment] = []
         dependents = self._find_dependents(mod.table_name)
+        n_dependents = len(dependents)
+        # Bodies mentioning the table, shared by every removed-column lookup below
+        table_hits = self._referencing(mod.table_name) if mod.table_name else None
 
         # Added columns (nullable) — almost no risk
         for col in mod.added_columns:
@@ -161,7 +247,9 @@ class RiskAssessor:
 
         # Removed columns — risky
         for col in mod.removed_columns:
-            col_dependents = self._find_column_dependents(mod.table_name, col.name)
+            col_dependents = (
+                self._filter_by_column(table_hits, col.name) if table_hits is not None else []
+            )
             score = 0.3 + 0.1 * len(col_dependents)
             risks.append(
                 RiskAssessment(
@@ -184,7 +272,9 @@ class RiskAssessor:
 
         # Modified columns
         for col_mod in mod.modified_columns:
-            score = self._score_column_change(col_mod.change_type, col_mod.is_breaking, dependents)
+            score = self._score_column_change(
+                col_mod.change_type, col_mod.is_breaking, n_dependents
+            )
             detail = f"{col_mod.old_value} → {col_mod.new_value}"
             risks.append(
                 RiskAssessment(
@@ -206,56 +296,147 @@ class RiskAssessor:
 
         return risks
 
+    @functools.cached_property
+    def _sp_items(self) -> list[tuple[str, str]]:
+        """(name, folded body) per SP, normalized on first lookup."""
+        return [
+            (sp.get("ROUTINE_NAME", ""), _fold(sp.get("ROUTINE_DEFINITION") or ""))
+            for sp in self.stored_procedures
+        ]
+
+    @functools.cached_property
+    def _view_items(self) -> list[tuple[str, str]]:
+        """(name, folded definition) per view, normalized on first lookup."""
+        return [
+            (view.get("TABLE_NAME", ""), _fold(view.get("VIEW_DEFINITION") or ""))
+            for view in self.views
+        ]
+
+    def _token_index(self) -> tuple[_BodyTokens, _BodyTokens]:
+        """Return the word-token indexes for SP and view bodies.
+
+        Each folded body is tokenized once into a frozenset, and every token
+        maps to the positions of the objects whose body contains it, in
+        original object order. Unfolded (non-ASCII) bodies are listed
+        separately and searched directly.
+        """
+        if self._sp_tokens is None:
+            self._sp_tokens = self._build_token_index(self._sp_items)
+            self._view_tokens = self._build_token_index(self._view_items)
+        return self._sp_tokens, self._view_tokens
+
+    @staticmethod
+    def _build_token_index(items: list[tuple[str, str]]) -> _BodyTokens:
+        """Tokenize each folded body once and build the token -> positions map."""
+        index = _BodyTokens()
+        postings = index.postings
+        for pos, (_, text) in enumerate(items):
+            if not text.isascii():
+                index.tokens.append(None)
+                index.unfolded.append(pos)
+                continue
+            tokens = frozenset(_WORD_RE.findall(text))
+            index.tokens.append(tokens)
+            for token in tokens:
+                positions = postings.get(token)
+                if positions is None:
+                    postings[token] = [pos]
+                else:
+                    positions.append(pos)
+        return index
+
     def _find_dependents(self, table_name: str) -> list[str]:
         """Find all SPs and views that reference a table."""
-        dependents: list[str] = []
-        for sp in self.stored_procedures:
-            body = sp.get("ROUTINE_DEFINITION") or ""
-            name = sp.get("ROUTINE_NAME", "")
-            if table_name and re.search(rf"\b{re.escape(table_name)}\b", body, re.IGNORECASE):
-                dependents.append(f"SP:{name}")
-        for view in self.views:
-            defn = view.get("VIEW_DEFINITION") or ""
-            name = view.get("TABLE_NAME", "")
-            if table_name and re.search(rf"\b{re.escape(table_name)}\b", defn, re.IGNORECASE):
-                dependents.append(f"View:{name}")
-        return dependents
-
-    def _find_column_dependents(self, table_name: str, column_name: str) -> list[str]:
-        """Find objects that reference a specific column."""
-        dependents: list[str] = []
-        for sp in self.stored_procedures:
-            body = sp.get("ROUTINE_DEFINITION") or ""
-            name = sp.get("ROUTINE_NAME", "")
-            if (
-                table_name
-                and re.search(rf"\b{re.escape(table_name)}\b", body, re.IGNORECASE)
-                and re.search(rf"\b{re.escape(column_name)}\b", body, re.IGNORECASE)
-            ):
-                dependents.append(f"SP:{name}")
-        for view in self.views:
-            defn = view.get("VIEW_DEFINITION") or ""
-            name = view.get("TABLE_NAME", "")
-            if (
-                table_name
-                and re.search(rf"\b{re.escape(table_name)}\b", defn, re.IGNORECASE)
-                and re.search(rf"\b{re.escape(column_name)}\b", defn, re.IGNORECASE)
-            ):
-                dependents.append(f"View:{name}")
-        return dependents
+        key = ("table", table_name)
+        cached = self._dep_cache.get(key)
+        if cached is None:
+            cached = self._dep_cache[key] = self._scan_dependents(table_name)
+        return list(cached)
+
+    def _referencing(self, name: str) -> tuple[list[int], list[int]]:
+        """Positions of the SPs and views whose bodies mention ``name`` as a whole word."""
+        hits = self._ref_cache.get(name)
+        if hits is not None:
+            return hits
+        if name.isascii() and _WORD_RE.fullmatch(name):
+            sp_tokens, view_tokens = self._token_index()
+            hits = (
+                self._postings(sp_tokens, self._sp_items, name),
+                self._postings(view_tokens, self._view_items, name),
+            )
+        else:
+            hits = (
+                [i for i, (_, text) in enumerate(self._sp_items) if _mentions(text, name)],
+                [i for i, (_, text) in enumerate(self._view_items) if _mentions(text, name)],
+            )
+        self._ref_cache[name] = hits
+        return hits
+
+    @staticmethod
+    def _postings(index: _BodyTokens, items: list[tuple[str, str]], name: str) -> list[int]:
+        """Indexed positions for a word-only ASCII name, plus any unfolded body hits."""
+        positions = index.postings.get(name.lower(), [])
+        extra = [i for i in index.unfolded if _mentions(items[i][1], name)]
+        return sorted(positions + extra) if extra else positions
+
+    @staticmethod
+    def _body_has(
+        index: _BodyTokens, items: list[tuple[str, str]], pos: int, name: str, token: str | None
+    ) -> bool:
+        """Whether body ``pos`` mentions ``name``; ``token`` is its lowercased form if word-only."""
+        tokens = index.tokens[pos]
+        if token is not None and tokens is not None:
+            return token in tokens
+        return _mentions(items[pos][1], name)
+
+    def _scan_dependents(self, table_name: str) -> list[str]:
+        """Uncached body of :meth:`_find_dependents`."""
+        if not table_name:
+            return []
+        sp_hits, view_hits = self._referencing(table_name)
+        sps, views = self._sp_items, self._view_items
+        return [f"SP:{sps[i][0]}" for i in sp_hits] + [f"View:{views[i][0]}" for i in view_hits]
+
+    def _filter_by_column(
+        self, table_hits: tuple[list[int], list[int]], column_name: str
+    ) -> list[str]:
+        """Labels of the objects in ``table_hits`` that also mention ``column_name``.
+
+        ``table_hits`` is the :meth:`_referencing` result for the table, so
+        only bodies already known to mention the table are checked.
+        """
+        sp_hits, view_hits = table_hits
+        if not sp_hits and not view_hits:
+            return []
+        sps, views = self._sp_items, self._view_items
+        sp_index, view_index = self._token_index()
+        token = (
+            column_name.lower()
+            if column_name.isascii() and _WORD_RE.fullmatch(column_name)
+            else None
+        )
+        has = self._body_has
+        return [f"SP:{sps[i][0]}" for i in sp_hits if has(sp_index, sps, i, column_name, token)] + [
+            f"View:{views[i][0]}"
+            for i in view_hits
+            if has(view_index, views, i, column_name, token)
+        ]
 
     def _find_sp_callers(self, sp_name: str) -> list[str]:
         """Find SPs that call a given SP."""
-        callers: list[str] = []
-        for sp in self.stored_procedures:
-            body = sp.get("ROUTINE_DEFINITION") or ""
-            name = sp.get("ROUTINE_NAME", "")
-            if name != sp_name and re.search(rf"\b{re.escape(sp_name)}\b", body, re.IGNORECASE):
-                callers.append(f"SP:{name}")
-        return callers
+        key = ("caller", sp_name)
+        cached = self._dep_cache.get(key)
+        if cached is None:
+            cached = self._dep_cache[key] = self._scan_sp_callers(sp_name)
+        return list(cached)
+
+    def _scan_sp_callers(self, sp_name: str) -> list[str]:
+        """Uncached body of :meth:`_find_sp_callers`."""
+        sps = self._sp_items
+        return [f"SP:{sps[i][0]}" for i in self._referencing(sp_name)[0] if sps[i][0] != sp_name]
 
     @staticmethod
-    def _score_column_change(change_type: str, is_breaking: bool, dependents: list[str]) -> float:
+    def _score_column_change(change_type: str, is_breaking: bool, n_dependents: int) -> float:
         """Calculate risk score for a column modification."""
         base_scores = {
             "type_change": 0.2,
@@ -265,21 +446,13 @@ class RiskAssessor:
         }
         base = base_scores.get(change_type, 0.1)
         if is_breaking:
-            base += 0.05 * len(dependents)
+            base += 0.05 * n_dependents
         return base
 
     @staticmethod
     def _score_to_level(score: float) -> str:
         """Convert numeric risk score to label."""
-        if score >= 0.7:
-            return "CRITICAL"
-        if score >= 0.4:
-            return "HIGH"
-        if score >= 0.2:
-            return "MEDIUM"
-        if score >= 0.05:
-            return "LOW"
-        return "NONE"
+        return _LEVELS[bisect.bisect_right(_LEVEL_THRESHOLDS, score)]
 
 
 def calculate_overall_risk(risks: list[RiskAssessment]) -> str:
@@ -287,12 +460,4 @@ def calculate_overall_risk(risks: list[RiskAssessment]) -> str:
     if not risks:
         return "NONE"
     max_score = max(r.risk_score for r in risks)
-    if max_score >= 0.7:
-        return "CRITICAL"
-    if max_score >= 0.4:
-        return "HIGH"
-    if max_score >= 0.2:
-        return "MEDIUM"
-    if max_score >= 0.05:
-        return "LOW"
-    return "NONE"
+    return _LEVELS[bisect.bisect_right(_LEVEL_THRESHOLDS, max_score)]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from sqlforensic.diff.diff_result import (
@@ -14,6 +15,43 @@ from sqlforensic.diff.diff_result import (
 )
 
 
+def _or_empty(value: Any) -> Any:
+    """Normalize a missing or empty column default to ``""``."""
+    return value or ""
+
+
+def _always_breaking(src: Any, tgt: Any) -> bool:
+    """Treat any change of this attribute (e.g. data type) as breaking."""
+    return True
+
+
+def _never_breaking(src: Any, tgt: Any) -> bool:
+    """Treat any change of this attribute (e.g. default) as non-breaking."""
+    return False
+
+
+def _is_length_shrink(src: Any, tgt: Any) -> bool:
+    """Return True if the new (source) max length is shorter than the old (target) one."""
+    return bool((src or 0) < (tgt or 0))
+
+
+def _becomes_not_null(src: Any, tgt: Any) -> bool:
+    """Return True if a nullable column becomes NOT NULL, which breaks if NULLs exist."""
+    return bool(src == "NO" and tgt == "YES")
+
+
+# Column attributes compared by _diff_column, in report order:
+# (field, value when missing, normalizer, change_type, is_breaking(src, tgt), stringify)
+_COLUMN_CHECKS: tuple[
+    tuple[str, Any, Callable[[Any], Any] | None, str, Callable[[Any, Any], bool], bool], ...
+] = (
+    ("DATA_TYPE", "", str.lower, "type_change", _always_breaking, False),
+    ("CHARACTER_MAXIMUM_LENGTH", None, None, "length_change", _is_length_shrink, True),
+    ("IS_NULLABLE", "YES", None, "nullability_change", _becomes_not_null, False),
+    ("COLUMN_DEFAULT", None, _or_empty, "default_change", _never_breaking, False),
+)
+
+
 def _build_column(raw: dict[str, Any]) -> ColumnInfo:
     """Build a ColumnInfo from a raw column dict."""
     return ColumnInfo(
@@ -38,18 +76,19 @@ def _build_table_info(table: dict[str, Any]) -> TableInfo:
     )
 
 
-def _table_key(table: dict[str, Any]) -> str:
-    """Build a lookup key for a table."""
-    schema = table.get("TABLE_SCHEMA", "dbo")
-    name = table.get("TABLE_NAME", "")
-    return f"{schema}.{name}"
+def _table_key(table: dict[str, Any]) -> tuple[str, str]:
+    """Build a (schema, name) lookup key for a table."""
+    return (table.get("TABLE_SCHEMA", "dbo"), table.get("TABLE_NAME", ""))
 
 
-def _fk_key(fk: dict[str, Any]) -> str:
-    """Build a lookup key for a foreign key."""
+def _fk_key(fk: dict[str, Any]) -> tuple[str, str, str, str]:
+    """Build a (parent table, parent column, referenced table, referenced column) key."""
+    get = fk.get
     return (
-        f"{fk.get('parent_table', '')}.{fk.get('parent_column', '')}"
-        f"→{fk.get('referenced_table', '')}.{fk.get('referenced_column', '')}"
+        get("parent_table", ""),
+        get("parent_column", ""),
+        get("referenced_table", ""),
+        get("referenced_column", ""),
     )
 
 
@@ -69,17 +108,23 @@ def diff_tables(
     source_map = {_table_key(t): t for t in source_tables}
     target_map = {_table_key(t): t for t in target_tables}
 
-    source_keys = set(source_map.keys())
-    target_keys = set(target_map.keys())
-
-    added = [_build_table_info(source_map[k]) for k in sorted(source_keys - target_keys)]
-    removed = [_build_table_info(target_map[k]) for k in sorted(target_keys - source_keys)]
-
-    modified: list[TableModification] = []
-    for key in sorted(source_keys & target_keys):
-        mod = _diff_single_table(source_map[key], target_map[key])
+    # One pass over the source: popping each key from the target classifies it
+    # as added or common, and whatever is left in the target was removed.
+    # Most common tables are unchanged, so only the modifications get sorted.
+    added_keys: list[tuple[str, str]] = []
+    changed: dict[tuple[str, str], TableModification] = {}
+    for key, src in source_map.items():
+        tgt = target_map.pop(key, None)
+        if tgt is None:
+            added_keys.append(key)
+            continue
+        mod = _diff_single_table(src, tgt)
         if mod:
-            modified.append(mod)
+            changed[key] = mod
+
+    added = [_build_table_info(source_map[k]) for k in sorted(added_keys)]
+    removed = [_build_table_info(target_map[k]) for k in sorted(target_map)]
+    modified = [changed[k] for k in sorted(changed)]
 
     return TableDiff(added_tables=added, removed_tables=removed, modified_tables=modified)
 
@@ -89,19 +134,28 @@ def _diff_single_table(source: dict[str, Any], target: dict[str, Any]) -> TableM
 
     Returns None if no differences found.
     """
-    source_cols = {c.get("COLUMN_NAME", ""): c for c in source.get("columns", [])}
-    target_cols = {c.get("COLUMN_NAME", ""): c for c in target.get("columns", [])}
+    source_raw = source.get("columns", [])
+    target_raw = target.get("columns", [])
+    # Identical column rows can't produce a modification; decide that on the
+    # raw dicts before building any lookup maps or ColumnInfo objects
+    if source_raw == target_raw:
+        return None
 
-    src_names = set(source_cols.keys())
-    tgt_names = set(target_cols.keys())
+    source_cols = {c.get("COLUMN_NAME", ""): c for c in source_raw}
+    target_cols = {c.get("COLUMN_NAME", ""): c for c in target_raw}
+
+    src_names = source_cols.keys()
+    tgt_names = target_cols.keys()
 
     added = [_build_column(source_cols[n]) for n in sorted(src_names - tgt_names)]
     removed = [_build_column(target_cols[n]) for n in sorted(tgt_names - src_names)]
 
-    modified: list[ColumnModification] = []
-    for name in sorted(src_names & tgt_names):
+    changed: dict[str, list[ColumnModification]] = {}
+    for name in src_names & tgt_names:
         mods = _diff_column(source_cols[name], target_cols[name])
-        modified.extend(mods)
+        if mods:
+            changed[name] = mods
+    modified = [m for name in sorted(changed) for m in changed[name]]
 
     if not added and not removed and not modified:
         return None
@@ -119,63 +173,24 @@ def _diff_column(source: dict[str, Any], target: dict[str, Any]) -> list[ColumnM
     """Compare a single column between source and target."""
     mods: list[ColumnModification] = []
     col_name = source.get("COLUMN_NAME", "")
-
-    # Type change
-    src_type = source.get("DATA_TYPE", "").lower()
-    tgt_type = target.get("DATA_TYPE", "").lower()
-    if src_type != tgt_type:
-        mods.append(
-            ColumnModification(
-                column_name=col_name,
-                change_type="type_change",
-                old_value=tgt_type,
-                new_value=src_type,
-                is_breaking=True,
-            )
-        )
-
-    # Length change
-    src_len = source.get("CHARACTER_MAXIMUM_LENGTH")
-    tgt_len = target.get("CHARACTER_MAXIMUM_LENGTH")
-    if src_len != tgt_len and (src_len is not None or tgt_len is not None):
-        is_shrink = (src_len or 0) < (tgt_len or 0)
-        mods.append(
-            ColumnModification(
-                column_name=col_name,
-                change_type="length_change",
-                old_value=str(tgt_len),
-                new_value=str(src_len),
-                is_breaking=is_shrink,
-            )
-        )
-
-    # Nullability change
-    src_nullable = source.get("IS_NULLABLE", "YES")
-    tgt_nullable = target.get("IS_NULLABLE", "YES")
-    if src_nullable != tgt_nullable:
-        # Becoming NOT NULL is breaking if NULLs exist
-        is_breaking = src_nullable == "NO" and tgt_nullable == "YES"
-        mods.append(
-            ColumnModification(
-                column_name=col_name,
-                change_type="nullability_change",
-                old_value=tgt_nullable,
-                new_value=src_nullable,
-                is_breaking=is_breaking,
-            )
-        )
-
-    # Default change
-    src_default = source.get("COLUMN_DEFAULT") or ""
-    tgt_default = target.get("COLUMN_DEFAULT") or ""
-    if src_default != tgt_default:
+    src_get = source.get
+    tgt_get = target.get
+
+    for field, missing, normalize, change_type, is_breaking, stringify in _COLUMN_CHECKS:
+        src = src_get(field, missing)
+        tgt = tgt_get(field, missing)
+        if normalize is not None:
+            src = normalize(src)
+            tgt = normalize(tgt)
+        if src == tgt:
+            continue
         mods.append(
             ColumnModification(
                 column_name=col_name,
-                change_type="default_change",
-                old_value=tgt_default,
-                new_value=src_default,
-                is_breaking=False,
+                change_type=change_type,
+                old_value=str(tgt) if stringify else tgt,
+                new_value=str(src) if stringify else src,
+                is_breaking=is_breaking(src, tgt),
             )
         )
 
@@ -194,11 +209,11 @@ def diff_foreign_keys(
     source_map = {_fk_key(fk): fk for fk in source_fks}
     target_map = {_fk_key(fk): fk for fk in target_fks}
 
-    src_keys = set(source_map.keys())
-    tgt_keys = set(target_map.keys())
+    # Popping matched keys leaves only the removed FKs in target_map
+    added_keys = [k for k in source_map if target_map.pop(k, None) is None]
 
-    added = [_fk_to_info(source_map[k]) for k in sorted(src_keys - tgt_keys)]
-    removed = [_fk_to_info(target_map[k]) for k in sorted(tgt_keys - src_keys)]
+    added = [_fk_to_info(source_map[k]) for k in sorted(added_keys)]
+    removed = [_fk_to_info(target_map[k]) for k in sorted(target_map)]
 
     return added, removed
 
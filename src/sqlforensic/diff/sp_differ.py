@@ -4,14 +4,17 @@ from __future__ import annotations
 
 from typing import Any
 
-from sqlforensic.diff.diff_result import ObjectDiff, ObjectModification, hash_body
+from sqlforensic.diff.diff_result import (
+    ObjectDiff,
+    ObjectModification,
+    hash_body,
+    normalize_body,
+)
 
 
-def _object_key(obj: dict[str, Any], name_field: str, schema_field: str) -> str:
-    """Build a lookup key for a database object."""
-    schema = obj.get(schema_field, "")
-    name = obj.get(name_field, "")
-    return f"{schema}.{name}"
+def _object_key(obj: dict[str, Any], name_field: str, schema_field: str) -> tuple[str, str]:
+    """Build a (schema, name) lookup key for a database object."""
+    return (obj.get(schema_field, ""), obj.get(name_field, ""))
 
 
 def diff_procedures(
@@ -71,31 +74,47 @@ def _diff_objects(
     source_map = {_object_key(o, name_field, schema_field): o for o in source}
     target_map = {_object_key(o, name_field, schema_field): o for o in target}
 
-    src_keys = set(source_map.keys())
-    tgt_keys = set(target_map.keys())
-
-    added = [
-        {"schema": source_map[k].get(schema_field, ""), "name": source_map[k].get(name_field, "")}
-        for k in sorted(src_keys - tgt_keys)
-    ]
-    removed = [
-        {"schema": target_map[k].get(schema_field, ""), "name": target_map[k].get(name_field, "")}
-        for k in sorted(tgt_keys - src_keys)
-    ]
-
-    modified: list[ObjectModification] = []
-    for key in sorted(src_keys & tgt_keys):
-        src_hash = hash_body(source_map[key].get(body_field))
-        tgt_hash = hash_body(target_map[key].get(body_field))
+    # One pass over the source: popping each key from the target classifies it
+    # as added or common, and whatever is left in the target was removed.
+    # Only the (usually few) modified objects need sorting, not every common key.
+    added_keys: list[tuple[str, str]] = []
+    changed: dict[tuple[str, str], ObjectModification] = {}
+    for key, src_obj in source_map.items():
+        tgt_obj = target_map.pop(key, None)
+        if tgt_obj is None:
+            added_keys.append(key)
+            continue
+        # The same row object on both sides (e.g. shared metadata) can't differ
+        if src_obj is tgt_obj:
+            continue
+        src_body = src_obj.get(body_field) or ""
+        tgt_body = tgt_obj.get(body_field) or ""
+        # Unchanged bodies are the common case; a plain compare is far
+        # cheaper than normalizing and hashing both sides
+        if src_body == tgt_body:
+            continue
+        # Whitespace/case-only edits normalize to the same text and would
+        # hash equal; compare the normalized forms before paying for SHA-256.
+        # An empty body hashes to "" rather than a digest, so emptiness must
+        # match too.
+        src_norm = normalize_body(src_body)
+        tgt_norm = normalize_body(tgt_body)
+        if src_norm == tgt_norm and bool(src_body) == bool(tgt_body):
+            continue
+        src_hash = hash_body(src_body, normalized=src_norm)
+        tgt_hash = hash_body(tgt_body, normalized=tgt_norm)
         if src_hash != tgt_hash:
-            modified.append(
-                ObjectModification(
-                    name=source_map[key].get(name_field, ""),
-                    schema=source_map[key].get(schema_field, ""),
-                    object_type=object_type,
-                    source_hash=src_hash,
-                    target_hash=tgt_hash,
-                )
+            changed[key] = ObjectModification(
+                name=key[1],
+                schema=key[0],
+                object_type=object_type,
+                source_hash=src_hash,
+                target_hash=tgt_hash,
             )
 
+    # Keys are (schema, name) read from the object, so reuse them instead of
+    # looking the fields up again
+    added = [{"schema": schema, "name": name} for schema, name in sorted(added_keys)]
+    removed = [{"schema": schema, "name": name} for schema, name in sorted(target_map)]
+    modified = [changed[k] for k in sorted(changed)]
     return ObjectDiff(added=added, removed=removed, modified=modified)
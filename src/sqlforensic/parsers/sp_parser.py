@@ -2,27 +2,196 @@
 
 from __future__ import annotations
 
+import functools
+import logging
+import multiprocessing
 import re
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 from sqlforensic.utils.sql_patterns import (
-    CASE_PATTERN,
-    CURSOR_PATTERN,
-    DELETE_PATTERN,
-    DYNAMIC_SQL_PATTERN,
-    INSERT_PATTERN,
-    JOIN_PATTERN,
-    NOLOCK_PATTERN,
-    SELECT_FROM_PATTERN,
-    SELECT_STAR_PATTERN,
-    TABLE_REF_PATTERN,
-    TEMP_TABLE_PATTERN,
-    UPDATE_PATTERN,
+    CASE_RE,
+    CURSOR_RE,
+    DELETE_RE,
+    DYNAMIC_SQL_RE,
+    INSERT_RE,
+    JOIN_RE,
+    NOLOCK_RE,
+    SELECT_FROM_RE,
+    SELECT_STAR_RE,
+    TABLE_REF_RE,
+    TEMP_TABLE_RE,
+    UPDATE_RE,
 )
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Below this many procedures, process start-up and pickling cost more than
+# parsing everything in-process
+_PARALLEL_MIN_SPS = 1000
+_PARALLEL_CHUNKSIZE = 64
+
+# Case-insensitive "sp_executesql" without lowercasing a copy of the body;
+# re.ASCII keeps it equal to the old `in body.lower()` test (no U+017F -> s)
+_SP_EXECUTESQL_RE = re.compile(r"sp_executesql", re.IGNORECASE | re.ASCII)
+
+# Subquery nesting tokens: an opening paren that starts a SELECT, or any other
+# paren. No \b after SELECT and only these four whitespace characters, to
+# match what the depth calculation has always counted.
+_PAREN_RE = re.compile(r"\([ \t\r\n]*SELECT|[()]", re.IGNORECASE)
+
+# Parameter declarations inside a CREATE PROCEDURE header
+_PARAM_RE = re.compile(
+    r"@(\w+)\s+([\w\(\),\s]+?)(?:\s*=\s*[^,\n]+)?(?:\s+OUTPUT|\s+OUT)?\s*(?:,|AS\b|\))",
+    re.IGNORECASE,
+)
+# CREATE PROCEDURE header with a parenthesized parameter list ...
+_PAREN_HEADER_RE = re.compile(
+    r"CREATE\s+(?:OR\s+ALTER\s+)?PROC(?:EDURE)?\s+[\w.\[\]]+\s*\((.*?)\)\s*AS",
+    re.IGNORECASE | re.DOTALL,
+)
+# ... or with a bare parameter list before AS
+_BARE_HEADER_RE = re.compile(
+    r"CREATE\s+(?:OR\s+ALTER\s+)?PROC(?:EDURE)?\s+[\w.\[\]]+\s+(.*?)\s+AS\b",
+    re.IGNORECASE | re.DOTALL,
+)
+# Both header forms can only start at a CREATE keyword
+_CREATE_RE = re.compile(r"CREATE", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class _BodyPatterns:
+    """The regexes :meth:`SPParser.parse` runs over a procedure body."""
+
+    table_ref: re.Pattern[str]
+    join: re.Pattern[str]
+    select_from: re.Pattern[str]
+    insert: re.Pattern[str]
+    update: re.Pattern[str]
+    delete: re.Pattern[str]
+    cursor: re.Pattern[str]
+    dynamic_sql: re.Pattern[str]
+    temp_table: re.Pattern[str]
+    case: re.Pattern[str]
+    select_star: re.Pattern[str]
+    nolock: re.Pattern[str]
+    paren: re.Pattern[str]
+    sp_executesql: re.Pattern[str]
+
+
+_IGNORECASE_PATTERNS = _BodyPatterns(
+    table_ref=TABLE_REF_RE,
+    join=JOIN_RE,
+    select_from=SELECT_FROM_RE,
+    insert=INSERT_RE,
+    update=UPDATE_RE,
+    delete=DELETE_RE,
+    cursor=CURSOR_RE,
+    dynamic_sql=DYNAMIC_SQL_RE,
+    temp_table=TEMP_TABLE_RE,
+    case=CASE_RE,
+    select_star=SELECT_STAR_RE,
+    nolock=NOLOCK_RE,
+    paren=_PAREN_RE,
+    sp_executesql=_SP_EXECUTESQL_RE,
+)
+
+
+def _lowercased(pattern: re.Pattern[str]) -> re.Pattern[str]:
+    """Case-sensitive twin of an IGNORECASE pattern, for matching lowered text."""
+    return re.compile(pattern.pattern.lower(), pattern.flags & ~re.IGNORECASE)
+
+
+# Run over body.lower() for ASCII bodies: case-folding is paid once per body
+# rather than per pattern per character, and literal keywords let the engine
+# skip ahead. On ASCII text this is exactly IGNORECASE (the patterns only use
+# lowercase escapes such as \s, \w and \b), and lower() keeps every offset,
+# so captures are sliced from the original body.
+_LOWERCASE_PATTERNS = _BodyPatterns(
+    *(_lowercased(getattr(_IGNORECASE_PATTERNS, f.name)) for f in fields(_BodyPatterns))
+)
+
+
+# Tokens that the table-name captures can pick up but are SQL keywords
+_SQL_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "select",
+        "from",
+        "where",
+        "insert",
+        "into",
+        "update",
+        "delete",
+        "join",
+        "inner",
+        "outer",
+        "left",
+        "right",
+        "cross",
+        "on",
+        "and",
+        "or",
+        "not",
+        "in",
+        "exists",
+        "between",
+        "like",
+        "is",
+        "null",
+        "set",
+        "values",
+        "as",
+        "begin",
+        "end",
+        "if",
+        "else",
+        "while",
+        "return",
+        "declare",
+        "exec",
+        "execute",
+        "create",
+        "alter",
+        "drop",
+        "table",
+        "procedure",
+        "function",
+        "view",
+        "index",
+        "trigger",
+        "grant",
+        "revoke",
+        "commit",
+        "rollback",
+        "transaction",
+        "group",
+        "order",
+        "by",
+        "having",
+        "union",
+        "all",
+        "distinct",
+        "top",
+        "limit",
+        "offset",
+        "fetch",
+        "next",
+        "rows",
+        "only",
+        "case",
+        "when",
+        "then",
+        "cast",
+        "convert",
+        "coalesce",
+    }
+)
+_MAX_KEYWORD_LEN = max(map(len, _SQL_KEYWORDS))
+
+
+@dataclass(slots=True)
 class SPParseResult:
     """Result of parsing a stored procedure body."""
 
@@ -68,112 +237,195 @@ class SPParser:
         if not body:
             return result
 
+        lowered = body.isascii()
+        if lowered:
+            text, patterns = body.lower(), _LOWERCASE_PATTERNS
+        else:
+            text, patterns = body, _IGNORECASE_PATTERNS
+
+        # Patterns needed by more than one extractor are scanned once and shared.
+        # On lowered text a missing keyword rules out a keyword-led scan exactly,
+        # and the substring test is far cheaper than the regex.
+        joins = _captures(patterns.join, text, body, 2) if not lowered or "join" in text else []
+        select_froms = _captures(patterns.select_from, text, body, 1)
+
         result.line_count = len(body.strip().splitlines())
-        result.referenced_tables = self._extract_table_references(body)
-        result.crud_operations = self._extract_crud_operations(body)
-        result.join_count = len(re.findall(JOIN_PATTERN, body, re.IGNORECASE))
-        result.subquery_depth = self._calculate_subquery_depth(body)
-        result.has_cursors = bool(re.search(CURSOR_PATTERN, body, re.IGNORECASE))
-        result.has_dynamic_sql = bool(re.search(DYNAMIC_SQL_PATTERN, body, re.IGNORECASE))
-        result.has_temp_tables = bool(re.search(TEMP_TABLE_PATTERN, body, re.IGNORECASE))
-        result.case_count = len(re.findall(CASE_PATTERN, body, re.IGNORECASE))
-        result.anti_patterns = self._detect_anti_patterns(body)
+        result.referenced_tables = self._extract_table_references(
+            _captures(patterns.table_ref, text, body, 2), joins, select_froms
+        )
+        result.crud_operations = self._extract_crud_operations(
+            select_froms,
+            _captures(patterns.insert, text, body, 1),
+            _captures(patterns.update, text, body, 1),
+            _captures(patterns.delete, text, body, 1),
+        )
+        result.join_count = len(joins)
+        # Literal pre-checks skip regex passes that cannot match: subqueries
+        # need "(", dynamic SQL needs "@" or a quote, temp tables "#" or "@",
+        # and (on lowered text) cursors need "cursor", "open" or "fetch"
+        result.subquery_depth = (
+            self._calculate_subquery_depth(text, patterns.paren) if "(" in body else 0
+        )
+        result.has_cursors = (
+            not lowered or "cursor" in text or "open" in text or "fetch" in text
+        ) and bool(patterns.cursor.search(text))
+        result.has_dynamic_sql = ("@" in body or "'" in body or '"' in body) and bool(
+            patterns.dynamic_sql.search(text)
+        )
+        result.has_temp_tables = ("#" in body or "@" in body) and bool(
+            patterns.temp_table.search(text)
+        )
+        # findall over a group-less pattern yields plain strings, which is
+        # cheaper than the match objects finditer would build just to count
+        result.case_count = len(patterns.case.findall(text)) if not lowered or "case" in text else 0
+        result.anti_patterns = self._detect_anti_patterns(
+            text, patterns, lowered, result.has_cursors, result.has_dynamic_sql
+        )
         result.parameters = self._extract_parameters(body)
         result.complexity_score = self._calculate_complexity(result)
         result.complexity_category = self._categorize_complexity(result.complexity_score)
 
         return result
 
-    def _extract_table_references(self, body: str) -> list[str]:
-        """Extract all table names referenced in the SP body."""
-        tables: set[str] = set()
-
-        for match in re.finditer(TABLE_REF_PATTERN, body, re.IGNORECASE):
-            table = match.group(2).strip().strip('[]"')
-            if not self._is_sql_keyword(table):
-                tables.add(table)
-
-        for match in re.finditer(JOIN_PATTERN, body, re.IGNORECASE):
-            table = match.group(2).strip().strip('[]"')
-            if not self._is_sql_keyword(table):
-                tables.add(table)
-
-        for match in re.finditer(SELECT_FROM_PATTERN, body, re.IGNORECASE):
-            table = match.group(1).strip().strip('[]"')
-            if not self._is_sql_keyword(table):
-                tables.add(table)
-
-        # Remove temp tables and common false positives
-        tables = {t for t in tables if not t.startswith(("#", "@", "temp", "tmp"))}
-        return sorted(tables)
-
-    def _extract_crud_operations(self, body: str) -> dict[str, list[str]]:
-        """Extract CRUD operations and their target tables."""
-        ops: dict[str, list[str]] = {
-            "SELECT": [],
-            "INSERT": [],
-            "UPDATE": [],
-            "DELETE": [],
-        }
-
-        for match in re.finditer(SELECT_FROM_PATTERN, body, re.IGNORECASE):
-            table = match.group(1).strip().strip('[]"')
-            if not self._is_sql_keyword(table) and table not in ops["SELECT"]:
-                ops["SELECT"].append(table)
-
-        for match in re.finditer(INSERT_PATTERN, body, re.IGNORECASE):
-            table = match.group(1).strip().strip('[]"')
-            if not self._is_sql_keyword(table) and table not in ops["INSERT"]:
-                ops["INSERT"].append(table)
-
-        for match in re.finditer(UPDATE_PATTERN, body, re.IGNORECASE):
-            table = match.group(1).strip().strip('[]"')
-            if not self._is_sql_keyword(table) and table not in ops["UPDATE"]:
-                ops["UPDATE"].append(table)
-
-        for match in re.finditer(DELETE_PATTERN, body, re.IGNORECASE):
-            table = match.group(1).strip().strip('[]"')
-            if not self._is_sql_keyword(table) and table not in ops["DELETE"]:
-                ops["DELETE"].append(table)
+    def parse_many(self, sps: list[dict[str, Any]], workers: int = 1) -> list[SPParseResult]:
+        """Parse many stored procedures, optionally in worker processes.
+
+        Parsing is serial unless more than one worker is requested. Parallel
+        parsing only kicks in for large batches, and uses forkserver (or spawn
+        where that is unavailable) rather than fork, so it is safe to call
+        from a process that is already running threads. As with any spawned
+        pool, scripts calling this must guard their entry point with
+        ``if __name__ == "__main__":``. A pool that cannot be started falls
+        back to in-process parsing.
+
+        Args:
+            sps: Procedure dicts as accepted by :meth:`parse`.
+            workers: Maximum worker processes; 1 (the default) parses in-process.
+
+        Returns:
+            One SPParseResult per input, in input order.
+        """
+        if workers <= 1 or len(sps) < _PARALLEL_MIN_SPS:
+            return [self.parse(sp) for sp in sps]
+
+        start_method = (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(start_method)
+            ) as pool:
+                return list(pool.map(_parse_one, sps, chunksize=_PARALLEL_CHUNKSIZE))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            logger.warning("Parallel SP parsing unavailable, parsing serially", exc_info=True)
+            return [self.parse(sp) for sp in sps]
+
+    def _extract_table_references(
+        self, table_refs: list[str], joins: list[str], select_froms: list[str]
+    ) -> list[str]:
+        """Extract all table names referenced in the SP body.
+
+        Args:
+            table_refs: Table captures of ``TABLE_REF_RE`` over the body.
+            joins: Table captures of ``JOIN_RE`` over the body.
+            select_froms: Table captures of ``SELECT_FROM_RE`` over the body.
+        """
+        # Captures are \[?\w+\]? (TABLE_REF, JOIN) or bare \w+ (SELECT_FROM), so
+        # stripping brackets is the only cleanup needed. Collect distinct
+        # names first so each is filtered once, however often it appears.
+        candidates = {raw.strip("[]") for raw in table_refs}
+        candidates.update(raw.strip("[]") for raw in joins)
+        candidates.update(select_froms)
+
+        # Drop keywords, temp tables and common false positives
+        return sorted(
+            t
+            for t in candidates
+            if not self._is_sql_keyword(t) and not t.startswith(("#", "@", "temp", "tmp"))
+        )
+
+    def _extract_crud_operations(
+        self,
+        select_froms: list[str],
+        inserts: list[str],
+        updates: list[str],
+        deletes: list[str],
+    ) -> dict[str, list[str]]:
+        """Extract CRUD operations and their target tables.
+
+        Args:
+            select_froms: Table captures of ``SELECT_FROM_RE`` over the body.
+            inserts: Table captures of ``INSERT_RE`` over the body.
+            updates: Table captures of ``UPDATE_RE`` over the body.
+            deletes: Table captures of ``DELETE_RE`` over the body.
+        """
+        captures = (
+            ("SELECT", select_froms),
+            ("INSERT", inserts),
+            ("UPDATE", updates),
+            ("DELETE", deletes),
+        )
+        ops: dict[str, list[str]] = {}
+        for op, raw_tables in captures:
+            # First-seen order is kept; the side set makes each dedupe check O(1)
+            tables: list[str] = []
+            seen: set[str] = set()
+            for raw in raw_tables:
+                table = raw.strip().strip('[]"')
+                if table not in seen and not self._is_sql_keyword(table):
+                    seen.add(table)
+                    tables.append(table)
+            ops[op] = tables
 
         return ops
 
-    def _calculate_subquery_depth(self, body: str) -> int:
+    def _calculate_subquery_depth(self, text: str, paren_re: re.Pattern[str]) -> int:
         """Calculate maximum nesting depth of subqueries."""
         max_depth = 0
         current_depth = 0
-        upper = body.upper()
-        i = 0
-        while i < len(upper):
-            if upper[i] == "(":
-                # Skip whitespace after opening paren to find SELECT
-                j = i + 1
-                while j < len(upper) and upper[j] in " \t\r\n":
-                    j += 1
-                if upper[j : j + 6] == "SELECT":
-                    current_depth += 1
-                    max_depth = max(max_depth, current_depth)
-            elif upper[i] == ")":
+        for match in paren_re.finditer(text):
+            token = match.group()
+            if token == ")":
                 if current_depth > 0:
                     current_depth -= 1
-            i += 1
+            elif token != "(":
+                current_depth += 1
+                if current_depth > max_depth:
+                    max_depth = current_depth
         return max_depth
 
-    def _detect_anti_patterns(self, body: str) -> list[str]:
-        """Detect SQL anti-patterns in the procedure body."""
+    def _detect_anti_patterns(
+        self,
+        text: str,
+        body_patterns: _BodyPatterns,
+        lowered: bool,
+        has_cursors: bool,
+        has_dynamic_sql: bool,
+    ) -> list[str]:
+        """Detect SQL anti-patterns in the procedure body.
+
+        ``lowered`` tells whether ``text`` is the lowercased body, in which
+        case plain substring tests stand in for the literal-only regexes.
+        ``has_cursors``/``has_dynamic_sql`` are the results of the cursor and
+        dynamic-SQL searches already run by :meth:`parse`.
+        """
         patterns: list[str] = []
 
-        if re.search(SELECT_STAR_PATTERN, body, re.IGNORECASE):
+        if "*" in text and body_patterns.select_star.search(text):
             patterns.append("SELECT * usage — specify columns explicitly")
 
-        if re.search(NOLOCK_PATTERN, body, re.IGNORECASE):
+        if (not lowered or "nolock" in text) and body_patterns.nolock.search(text):
             patterns.append("NOLOCK hint — may cause dirty reads")
 
-        if re.search(CURSOR_PATTERN, body, re.IGNORECASE):
+        if has_cursors:
             patterns.append("Cursor usage — consider set-based operations")
 
-        if re.search(DYNAMIC_SQL_PATTERN, body, re.IGNORECASE):
-            if "sp_executesql" not in body.lower():
+        if has_dynamic_sql:
+            if lowered:
+                uses_executesql = "sp_executesql" in text
+            else:
+                uses_executesql = bool(body_patterns.sp_executesql.search(text))
+            if not uses_executesql:
                 patterns.append(
                     "Dynamic SQL with string concatenation — use sp_executesql with parameters"
                 )
@@ -183,27 +435,29 @@ class SPParser:
     def _extract_parameters(self, body: str) -> list[dict[str, str]]:
         """Extract input/output parameters from the SP definition."""
         params: list[dict[str, str]] = []
-        param_pattern = re.compile(
-            r"@(\w+)\s+([\w\(\),\s]+?)(?:\s*=\s*[^,\n]+)?(?:\s+OUTPUT|\s+OUT)?\s*(?:,|AS\b|\))",
-            re.IGNORECASE,
-        )
-
-        # Look in CREATE PROCEDURE header
-        header_match = re.search(
-            r"CREATE\s+(?:OR\s+ALTER\s+)?PROC(?:EDURE)?\s+[\w.\[\]]+\s*\((.*?)\)\s*AS",
-            body,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if not header_match:
-            header_match = re.search(
-                r"CREATE\s+(?:OR\s+ALTER\s+)?PROC(?:EDURE)?\s+[\w.\[\]]+\s+(.*?)\s+AS\b",
-                body,
-                re.IGNORECASE | re.DOTALL,
-            )
+        if "@" not in body:
+            # Every parameter is declared with "@"; skip the header search
+            return params
+
+        # Look in CREATE PROCEDURE header. Both forms start at a CREATE
+        # keyword: walk those once, trying the parenthesized form at each, and
+        # only fall back to the bare form (any parenthesized header wins).
+        starts: list[int] = []
+        header_match = None
+        for create in _CREATE_RE.finditer(body):
+            starts.append(create.start())
+            header_match = _PAREN_HEADER_RE.match(body, create.start())
+            if header_match:
+                break
+        else:
+            for pos in starts:
+                header_match = _BARE_HEADER_RE.match(body, pos)
+                if header_match:
+                    break
 
         if header_match:
             header = header_match.group(1)
-            for match in param_pattern.finditer(header):
+            for match in _PARAM_RE.finditer(header):
                 direction = "OUTPUT" if "output" in match.group(0).lower() else "INPUT"
                 params.append(
                     {
@@ -266,77 +520,26 @@ class SPParser:
         return "Simple"
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _is_sql_keyword(token: str) -> bool:
-        """Check if a token is a SQL keyword rather than a table name."""
-        keywords = {
-            "select",
-            "from",
-            "where",
-            "insert",
-            "into",
-            "update",
-            "delete",
-            "join",
-            "inner",
-            "outer",
-            "left",
-            "right",
-            "cross",
-            "on",
-            "and",
-            "or",
-            "not",
-            "in",
-            "exists",
-            "between",
-            "like",
-            "is",
-            "null",
-            "set",
-            "values",
-            "as",
-            "begin",
-            "end",
-            "if",
-            "else",
-            "while",
-            "return",
-            "declare",
-            "exec",
-            "execute",
-            "create",
-            "alter",
-            "drop",
-            "table",
-            "procedure",
-            "function",
-            "view",
-            "index",
-            "trigger",
-            "grant",
-            "revoke",
-            "commit",
-            "rollback",
-            "transaction",
-            "group",
-            "order",
-            "by",
-            "having",
-            "union",
-            "all",
-            "distinct",
-            "top",
-            "limit",
-            "offset",
-            "fetch",
-            "next",
-            "rows",
-            "only",
-            "case",
-            "when",
-            "then",
-            "cast",
-            "convert",
-            "coalesce",
-        }
-        return token.lower() in keywords
+        """Check if a token is a SQL keyword rather than a table name.
+
+        Memoized: the same table names recur across procedures, so repeat
+        lookups skip the ``lower()`` copy.
+        """
+        # Lowercasing never shortens a string, so longer tokens can't be keywords
+        return len(token) <= _MAX_KEYWORD_LEN and token.lower() in _SQL_KEYWORDS
+
+
+def _parse_one(sp: dict[str, Any]) -> SPParseResult:
+    """Parse a single procedure in a worker process (module-level so it pickles)."""
+    return SPParser().parse(sp)
+
+
+def _captures(pattern: re.Pattern[str], text: str, body: str, group: int) -> list[str]:
+    """Return ``group`` of every match of ``pattern`` in ``text``, taken from ``body``.
+
+    ``text`` is either ``body`` itself or its same-length lowercase copy, so
+    the spans line up and captured names keep their original case.
+    """
+    return [body[m.start(group) : m.end(group)] for m in pattern.finditer(text)]
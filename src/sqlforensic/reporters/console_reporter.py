@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from rich import get_console
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -27,7 +28,7 @@ class ConsoleReporter:
 
     def __init__(self, report: AnalysisReport, console: Console | None = None) -> None:
         self.report = report
-        self.console = console or Console()
+        self.console = console or get_console()
 
     def print_report(self) -> None:
         """Print the full analysis report to the console."""
@@ -64,15 +65,19 @@ class ConsoleReporter:
 
     def _print_overview(self) -> None:
         """Print schema overview table."""
+        rows = [
+            (
+                key.replace("_", " ").title(),
+                format_row_count(value) if isinstance(value, int) else str(value),
+            )
+            for key, value in self.report.schema_overview.items()
+        ]
+
         table = Table(title="Schema Overview")
         table.add_column("Metric", style="bold")
         table.add_column("Count", justify="right")
-
-        overview = self.report.schema_overview
-        for key, value in overview.items():
-            label = key.replace("_", " ").title()
-            display = format_row_count(value) if isinstance(value, int) else str(value)
-            table.add_row(label, display)
+        for row in rows:
+            table.add_row(*row)
 
         self.console.print(table)
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from rich import get_console
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -36,7 +37,7 @@ class DiffConsoleReporter:
 
     def __init__(self, diff: DiffResult, console: Console | None = None) -> None:
         self.diff = diff
-        self.console = console or Console()
+        self.console = console or get_console()
 
     # ------------------------------------------------------------------
     # Public API
@@ -10,13 +10,15 @@ import os
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from sqlforensic.reporters.html_reporter import TEMPLATE_ENV
 
 if TYPE_CHECKING:
     from sqlforensic.diff.diff_result import DiffResult
 
 TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
 
+_DIFF_TEMPLATE = TEMPLATE_ENV.get_template("diff_report.html")
+
 
 class DiffHTMLReporter:
     """Export schema diff results as a self-contained interactive HTML report.
@@ -28,10 +30,7 @@ class DiffHTMLReporter:
 
     def __init__(self, diff: DiffResult) -> None:
         self.diff = diff
-        self.env = Environment(
-            loader=FileSystemLoader(TEMPLATE_DIR),
-            autoescape=select_autoescape(["html"]),
-        )
+        self.env = TEMPLATE_ENV
 
     def export(self, output_path: str) -> None:
         """Export full HTML diff report.
@@ -39,12 +38,11 @@ class DiffHTMLReporter:
         Args:
             output_path: Path to write the HTML file.
         """
-        template = self.env.get_template("diff_report.html")
-        html = template.render(
+        stream = _DIFF_TEMPLATE.stream(
             diff=self.diff,
             summary=self.diff.summary,
             generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         )
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        with open(output_path, "wb") as f:
+            stream.dump(f, encoding="utf-8")
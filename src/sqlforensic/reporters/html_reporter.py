@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 from datetime import datetime
@@ -16,6 +17,18 @@ if TYPE_CHECKING:
 
 TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
 
+# Shared by every reporter instance (and DiffHTMLReporter) so Jinja's
+# per-environment template cache survives across exports.
+TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(["html"]),
+)
+TEMPLATE_ENV.filters["row_count"] = format_row_count
+TEMPLATE_ENV.filters["file_size"] = format_size
+
+_REPORT_TEMPLATE = TEMPLATE_ENV.get_template("report.html")
+_GRAPH_TEMPLATE = TEMPLATE_ENV.get_template("dependency_graph.html")
+
 
 class HTMLReporter:
     """Export analysis results as a self-contained interactive HTML report.
@@ -27,12 +40,7 @@ class HTMLReporter:
 
     def __init__(self, report: AnalysisReport) -> None:
         self.report = report
-        self.env = Environment(
-            loader=FileSystemLoader(TEMPLATE_DIR),
-            autoescape=select_autoescape(["html"]),
-        )
-        self.env.filters["row_count"] = format_row_count
-        self.env.filters["file_size"] = format_size
+        self.env = TEMPLATE_ENV
 
     def export(self, output_path: str) -> None:
         """Export full HTML report.
@@ -40,8 +48,7 @@ class HTMLReporter:
         Args:
             output_path: Path to write the HTML file.
         """
-        template = self.env.get_template("report.html")
-        html = template.render(
+        stream = _REPORT_TEMPLATE.stream(
             report=self.report,
             generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             graph_data=self._build_graph_json(),
@@ -49,8 +56,8 @@ class HTMLReporter:
             graph_js=self._load_asset("assets/graph.js"),
         )
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        with open(output_path, "wb") as f:
+            stream.dump(f, encoding="utf-8")
 
     def export_graph(self, output_path: str) -> None:
         """Export only the interactive dependency graph.
@@ -58,8 +65,7 @@ class HTMLReporter:
         Args:
             output_path: Path to write the HTML file.
         """
-        template = self.env.get_template("dependency_graph.html")
-        html = template.render(
+        stream = _GRAPH_TEMPLATE.stream(
             report=self.report,
             generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             graph_data=self._build_graph_json(),
@@ -67,8 +73,8 @@ class HTMLReporter:
             graph_js=self._load_asset("assets/graph.js"),
         )
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        with open(output_path, "wb") as f:
+            stream.dump(f, encoding="utf-8")
 
     def _build_graph_json(self) -> str:
         """Build JSON data for the D3.js dependency graph."""
@@ -76,38 +82,30 @@ class HTMLReporter:
         if not isinstance(deps, dict):
             return json.dumps({"nodes": [], "links": []})
 
-        nodes_raw = deps.get("nodes", [])
-        edges_raw = deps.get("edges", [])
-
-        # Build node set
-        node_ids = {n["id"] for n in nodes_raw}
-        nodes = []
-        for n in nodes_raw:
-            criticality = n.get("in_degree", 0) + n.get("out_degree", 0)
-            nodes.append(
-                {
-                    "id": n["id"],
-                    "type": n.get("type", "unknown"),
-                    "criticality": criticality,
-                }
-            )
-
-        # Build link set (only include links where both nodes exist)
-        links = []
-        for e in edges_raw:
-            if e["source"] in node_ids and e["target"] in node_ids:
-                links.append(
-                    {
-                        "source": e["source"],
-                        "target": e["target"],
-                        "type": e.get("type", ""),
-                    }
-                )
-
-        return json.dumps({"nodes": nodes, "links": links}, default=str)
-
-    def _load_asset(self, relative_path: str) -> str:
-        """Load an asset file from the templates directory."""
+        nodes = [
+            {
+                "id": n["id"],
+                "type": n.get("type", "unknown"),
+                "criticality": n.get("in_degree", 0) + n.get("out_degree", 0),
+            }
+            for n in deps.get("nodes", [])
+        ]
+
+        # Only include links where both nodes exist
+        node_ids = {n["id"] for n in nodes}
+        links = [
+            {"source": e["source"], "target": e["target"], "type": e.get("type", "")}
+            for e in deps.get("edges", [])
+            if e["source"] in node_ids and e["target"] in node_ids
+        ]
+
+        # Compact separators: the payload is inlined into the page as a JS literal
+        return json.dumps({"nodes": nodes, "links": links}, separators=(",", ":"), default=str)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _load_asset(relative_path: str) -> str:
+        """Load an asset file from the templates directory (read once per process)."""
         path = os.path.join(TEMPLATE_DIR, relative_path)
         if os.path.exists(path):
             with open(path, encoding="utf-8") as f:
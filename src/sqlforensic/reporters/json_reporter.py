@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import itertools
 import json
-from datetime import datetime
-from typing import TYPE_CHECKING
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
 from sqlforensic import __version__
 
+try:  # optional: a much faster encoder for large reports
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
 if TYPE_CHECKING:
     from sqlforensic import AnalysisReport
 
+# Encoder chunks joined into each write on the stdlib path
+_WRITE_BATCH = 8192
+
 
 class JSONReporter:
     """Export analysis results as machine-readable JSON.
@@ -22,17 +33,21 @@ class JSONReporter:
     def __init__(self, report: AnalysisReport) -> None:
         self.report = report
 
-    def export(self, output_path: str) -> None:
+    def export(self, output_path: str, compact: bool = False) -> None:
         """Export report to JSON file.
 
         Args:
             output_path: Path to write the JSON file.
+            compact: Omit empty sections (and empty keys inside section
+                objects) instead of writing them as ``[]``/``{}``/``null``.
+                ``metadata.compact`` is set so consumers know a missing key
+                means "nothing found".
         """
-        data = {
+        data: dict[str, Any] = {
             "metadata": {
                 "tool": "SQLForensic",
                 "version": __version__,
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
                 "database": self.report.database,
                 "provider": self.report.provider,
             },
@@ -40,10 +55,7 @@ class JSONReporter:
             "schema_overview": self.report.schema_overview,
             "tables": self.report.tables,
             "views": self.report.views,
-            "stored_procedures": [
-                {k: v for k, v in sp.items() if k != "ROUTINE_DEFINITION"}
-                for sp in self.report.stored_procedures
-            ],
+            "stored_procedures": [_without_definition(sp) for sp in self.report.stored_procedures],
             "relationships": {
                 "explicit": self.report.relationships,
                 "implicit": self.report.implicit_relationships,
@@ -67,6 +79,53 @@ class JSONReporter:
             "security_issues": self.report.security_issues,
             "size_info": self.report.size_info,
         }
+        if compact:
+            data = _drop_empty(data)
+            data["metadata"]["compact"] = True
+
+        if _HAS_ORJSON:
+            # Let default=str handle datetimes and dataclasses, as the stdlib
+            # path does, instead of orjson's native encodings of them
+            options = (
+                orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+            with open(output_path, "wb") as fb:
+                fb.write(orjson.dumps(data, default=str, option=options))
+            return
 
+        # Same chunks json.dump would write, but joined into batches: one
+        # write per batch instead of per token, with memory still bounded
+        chunks = json.JSONEncoder(indent=2, default=str, ensure_ascii=False).iterencode(data)
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+            while batch := list(itertools.islice(chunks, _WRITE_BATCH)):
+                f.write("".join(batch))
+
+
+def _without_definition(sp: dict[str, Any]) -> dict[str, Any]:
+    """Copy an SP row without its body (a C-level copy, not a per-key rebuild)."""
+    row = sp.copy()
+    row.pop("ROUTINE_DEFINITION", None)
+    return row
+
+
+def _is_empty(value: Any) -> bool:
+    """True for None and empty strings, lists, tuples and dicts (not 0/False)."""
+    return value is None or (isinstance(value, (str, list, tuple, dict)) and not value)
+
+
+def _drop_empty(data: dict[str, Any]) -> dict[str, Any]:
+    """Drop empty top-level sections and empty keys one level down.
+
+    Metadata is kept whole; nested section dicts are filtered into new dicts,
+    so the report's own objects are never modified.
+    """
+    compacted: dict[str, Any] = {}
+    for key, value in data.items():
+        if key != "metadata" and isinstance(value, dict):
+            value = {k: v for k, v in value.items() if not _is_empty(v)}
+        if not _is_empty(value):
+            compacted[key] = value
+    return compacted
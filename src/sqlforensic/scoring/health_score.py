@@ -6,6 +6,7 @@ of schema quality, index coverage, dead code, and dependencies.
 
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -32,156 +33,106 @@ class HealthScoreCalculator:
 
     def calculate(self) -> int:
         """Calculate and return health score (0-100)."""
+        report = self.report
+        no_pk_tables, no_idx_tables = self._count_table_gaps()
+        # (count, description, severity, category, points per item, max penalty)
+        rules: tuple[tuple[int, str, str, str, int, int | None], ...] = (
+            (
+                no_pk_tables,
+                "Tables with no primary key",
+                "HIGH",
+                "schema",
+                5,
+                None,
+            ),
+            (
+                len(report.missing_indexes),
+                "Missing foreign key indexes",
+                "HIGH",
+                "indexes",
+                2,
+                20,
+            ),
+            (
+                len(report.dead_procedures),
+                "Unused stored procedures",
+                "MEDIUM",
+                "dead_code",
+                1,
+                15,
+            ),
+            (
+                no_idx_tables,
+                "Tables with no indexes",
+                "HIGH",
+                "indexes",
+                5,
+                None,
+            ),
+            (
+                len(report.circular_dependencies),
+                "Circular dependencies detected",
+                "HIGH",
+                "dependencies",
+                10,
+                None,
+            ),
+            (
+                sum(1 for sp in report.sp_analysis if sp.get("complexity_score", 0) > 50),
+                "SPs with complexity score > 50",
+                "MEDIUM",
+                "complexity",
+                2,
+                15,
+            ),
+            (
+                len(report.duplicate_indexes),
+                "Duplicate indexes",
+                "MEDIUM",
+                "indexes",
+                2,
+                10,
+            ),
+            (
+                len(report.dead_tables),
+                "Tables with no relationships",
+                "MEDIUM",
+                "dead_code",
+                2,
+                10,
+            ),
+            (
+                len(report.empty_tables),
+                "Empty tables (0 rows)",
+                "LOW",
+                "dead_code",
+                1,
+                5,
+            ),
+            (
+                len(report.security_issues),
+                "Security concerns found",
+                "HIGH",
+                "security",
+                3,
+                15,
+            ),
+        )
+
         score = 100
         self._issues = []
-
-        # Tables without primary key
-        no_pk_tables = self._count_tables_without_pk()
-        if no_pk_tables > 0:
-            penalty = no_pk_tables * 5
-            score -= penalty
-            self._issues.append(
-                {
-                    "description": "Tables with no primary key",
-                    "severity": "HIGH",
-                    "count": no_pk_tables,
-                    "penalty": penalty,
-                    "category": "schema",
-                }
-            )
-
-        # Missing foreign key indexes
-        missing_fk_idx = len(self.report.missing_indexes)
-        if missing_fk_idx > 0:
-            penalty = min(missing_fk_idx * 2, 20)
-            score -= penalty
-            self._issues.append(
-                {
-                    "description": "Missing foreign key indexes",
-                    "severity": "HIGH",
-                    "count": missing_fk_idx,
-                    "penalty": penalty,
-                    "category": "indexes",
-                }
-            )
-
-        # Dead procedures
-        dead_sp_count = len(self.report.dead_procedures)
-        if dead_sp_count > 0:
-            penalty = min(dead_sp_count, 15)
-            score -= penalty
-            self._issues.append(
-                {
-                    "description": "Unused stored procedures",
-                    "severity": "MEDIUM",
-                    "count": dead_sp_count,
-                    "penalty": penalty,
-                    "category": "dead_code",
-                }
-            )
-
-        # Tables without indexes
-        no_idx_tables = self._count_tables_without_indexes()
-        if no_idx_tables > 0:
-            penalty = no_idx_tables * 5
-            score -= penalty
-            self._issues.append(
-                {
-                    "description": "Tables with no indexes",
-                    "severity": "HIGH",
-                    "count": no_idx_tables,
-                    "penalty": penalty,
-                    "category": "indexes",
-                }
-            )
-
-        # Circular dependencies
-        circular_count = len(self.report.circular_dependencies)
-        if circular_count > 0:
-            penalty = circular_count * 10
-            score -= penalty
-            self._issues.append(
-                {
-                    "description": "Circular dependencies detected",
-                    "severity": "HIGH",
-                    "count": circular_count,
-                    "penalty": penalty,
-                    "category": "dependencies",
-                }
-            )
-
-        # High-complexity stored procedures
-        complex_sps = [sp for sp in self.report.sp_analysis if sp.get("complexity_score", 0) > 50]
-        if complex_sps:
-            penalty = min(len(complex_sps) * 2, 15)
+        for count, description, severity, category, points, cap in rules:
+            if count <= 0:
+                continue
+            penalty = count * points if cap is None else min(count * points, cap)
             score -= penalty
             self._issues.append(
                 {
-                    "description": "SPs with complexity score > 50",
-                    "severity": "MEDIUM",
-                    "count": len(complex_sps),
+                    "description": description,
+                    "severity": severity,
+                    "count": count,
                     "penalty": penalty,
-                    "category": "complexity",
-                }
-            )
-
-        # Duplicate indexes
-        dup_count = len(self.report.duplicate_indexes)
-        if dup_count > 0:
-            penalty = min(dup_count * 2, 10)
-            score -= penalty
-            self._issues.append(
-                {
-                    "description": "Duplicate indexes",
-                    "severity": "MEDIUM",
-                    "count": dup_count,
-                    "penalty": penalty,
-                    "category": "indexes",
-                }
-            )
-
-        # Dead tables
-        dead_table_count = len(self.report.dead_tables)
-        if dead_table_count > 0:
-            penalty = min(dead_table_count * 2, 10)
-            score -= penalty
-            self._issues.append(
-                {
-                    "description": "Tables with no relationships",
-                    "severity": "MEDIUM",
-                    "count": dead_table_count,
-                    "penalty": penalty,
-                    "category": "dead_code",
-                }
-            )
-
-        # Empty tables
-        empty_count = len(self.report.empty_tables)
-        if empty_count > 0:
-            penalty = min(empty_count, 5)
-            score -= penalty
-            self._issues.append(
-                {
-                    "description": "Empty tables (0 rows)",
-                    "severity": "LOW",
-                    "count": empty_count,
-                    "penalty": penalty,
-                    "category": "dead_code",
-                }
-            )
-
-        # Security issues
-        sec_count = len(self.report.security_issues)
-        if sec_count > 0:
-            penalty = min(sec_count * 3, 15)
-            score -= penalty
-            self._issues.append(
-                {
-                    "description": "Security concerns found",
-                    "severity": "HIGH",
-                    "count": sec_count,
-                    "penalty": penalty,
-                    "category": "security",
+                    "category": category,
                 }
             )
 
@@ -189,27 +140,23 @@ class HealthScoreCalculator:
 
     def get_issues(self) -> list[dict[str, Any]]:
         """Return list of identified issues (call after calculate())."""
-        return sorted(self._issues, key=lambda x: x["penalty"], reverse=True)
+        # A sorted copy, so repeated calls never see a caller's mutations
+        return sorted(self._issues, key=itemgetter("penalty"), reverse=True)
 
-    def _count_tables_without_pk(self) -> int:
-        """Count tables that have no primary key."""
-        count = 0
-        for table in self.report.tables:
-            columns = table.get("columns", [])
-            has_pk = any(col.get("is_primary_key") for col in columns)
-            if not has_pk and columns:
-                count += 1
-        return count
+    def _count_table_gaps(self) -> tuple[int, int]:
+        """Count tables without a primary key and tables without any index.
 
-    def _count_tables_without_indexes(self) -> int:
-        """Count tables that have zero indexes."""
-        indexed_tables: set[str] = set()
-        for idx in self.report.indexes:
-            indexed_tables.add(idx.get("table_name", ""))
+        Both counts come from a single walk over the tables.
+        """
+        indexed_tables = {idx.get("table_name", "") for idx in self.report.indexes}
 
-        count = 0
+        no_pk = no_idx = 0
         for table in self.report.tables:
+            # Tables without columns are skipped before scanning for a PK column
+            columns = table.get("columns")
+            if columns and not any(col.get("is_primary_key") for col in columns):
+                no_pk += 1
             name = table.get("TABLE_NAME", "")
             if name and name not in indexed_tables:
-                count += 1
-        return count
+                no_idx += 1
+        return no_pk, no_idx
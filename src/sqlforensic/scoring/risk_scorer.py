@@ -6,8 +6,12 @@ of modifying database objects during migration or refactoring.
 
 from __future__ import annotations
 
+from collections import Counter
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
+from sqlforensic.utils.formatting import risk_label
+
 if TYPE_CHECKING:
     from sqlforensic import AnalysisReport
 
@@ -49,28 +53,29 @@ class RiskScorer:
             for table in sp.get("referenced_tables", []):
                 table_sp_map.setdefault(table, []).append(sp.get("name", ""))
 
+        # Total complexity per SP name (names may repeat across schemas)
+        sp_complexity: dict[str | None, int] = {}
+        for sp in self.report.sp_analysis:
+            name = sp.get("name")
+            sp_complexity[name] = sp_complexity.get(name, 0) + sp.get("complexity_score", 0)
+
+        # FK dependencies: how many relationships reference each table
+        fk_counts = Counter(rel.get("referenced_table") for rel in self.report.relationships)
+
         for table in self.report.tables:
             table_name = table.get("TABLE_NAME", "")
             dependent_sps = table_sp_map.get(table_name, [])
             row_count = table.get("row_count", 0) or 0
 
-            # FK dependencies (tables that reference this one)
-            fk_deps = [
-                rel
-                for rel in self.report.relationships
-                if rel.get("referenced_table") == table_name
-            ]
+            fk_dep_count = fk_counts[table_name]
 
             # Calculate score components
             dep_score = min(len(dependent_sps) * 5, 40)
-            fk_score = min(len(fk_deps) * 5, 20)
+            fk_score = min(fk_dep_count * 5, 20)
             size_score = self._size_risk(row_count)
 
             # Complexity of dependent SPs
-            complexity_score = 0
-            for sp in self.report.sp_analysis:
-                if sp.get("name") in dependent_sps:
-                    complexity_score += sp.get("complexity_score", 0)
+            complexity_score = sum(sp_complexity.get(name, 0) for name in set(dependent_sps))
             complexity_score = min(complexity_score // 5, 20)
 
             total = min(dep_score + fk_score + size_score + complexity_score, 100)
@@ -83,29 +88,27 @@ class RiskScorer:
                     "risk_level": self._risk_level(total),
                     "dependent_sp_count": len(dependent_sps),
                     "dependent_sps": dependent_sps,
-                    "fk_dependency_count": len(fk_deps),
+                    "fk_dependency_count": fk_dep_count,
                     "row_count": row_count,
                 }
             )
 
-        return sorted(risks, key=lambda x: x["risk_score"], reverse=True)
+        risks.sort(key=itemgetter("risk_score"), reverse=True)
+        return risks
 
     def _calculate_sp_risks(self) -> list[dict[str, Any]]:
         """Calculate risk score for each stored procedure."""
         risks: list[dict[str, Any]] = []
 
-        # Build reverse dependency: SP -> SPs that call it
-        sp_callers: dict[str, list[str]] = {}
-        for sp in self.report.sp_analysis:
-            # This would require cross-reference data; simplified version
-            sp_name = sp.get("name", "")
-            sp_callers.setdefault(sp_name, [])
+        # Reverse dependencies (SP -> SPs that call it) would require
+        # cross-reference data the analysis does not collect yet, so every
+        # SP currently has zero callers.
+        caller_count = 0
 
         for sp in self.report.sp_analysis:
             sp_name = sp.get("name", "")
             complexity = sp.get("complexity_score", 0)
             table_count = len(sp.get("referenced_tables", []))
-            caller_count = len(sp_callers.get(sp_name, []))
 
             complexity_score = min(complexity, 40)
             dep_score = min(table_count * 5, 30)
@@ -125,7 +128,8 @@ class RiskScorer:
                 }
             )
 
-        return sorted(risks, key=lambda x: x["risk_score"], reverse=True)
+        risks.sort(key=itemgetter("risk_score"), reverse=True)
+        return risks
 
     @staticmethod
     def _size_risk(row_count: int) -> int:
@@ -143,12 +147,4 @@ class RiskScorer:
     @staticmethod
     def _risk_level(score: int) -> str:
         """Convert numeric risk score to label."""
-        if score >= 80:
-            return "CRITICAL"
-        if score >= 60:
-            return "HIGH"
-        if score >= 40:
-            return "MEDIUM"
-        if score >= 20:
-            return "LOW"
-        return "MINIMAL"
+        return risk_label(score)
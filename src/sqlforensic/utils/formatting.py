@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 
 def format_row_count(count: int | None) -> str:
     """Format row count with human-readable suffixes.
@@ -14,6 +16,16 @@ def format_row_count(count: int | None) -> str:
     """
     if count is None:
         return "N/A"
+    return _format_row_count(count)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _format_row_count(count: int) -> str:
+    """Cached body of :func:`format_row_count`.
+
+    Report tables repeat the same counts (0, small lookup tables, ...); the
+    cache is typed so that e.g. 1, 1.0 and True keep their own formatting.
+    """
     if count >= 1_000_000:
         return f"{count / 1_000_000:.1f}M"
     if count >= 1_000:
@@ -32,6 +44,12 @@ def format_size(kb: int | None) -> str:
     """
     if kb is None:
         return "N/A"
+    return _format_size(kb)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _format_size(kb: int) -> str:
+    """Cached body of :func:`format_size`, typed like :func:`_format_row_count`."""
     if kb >= 1_048_576:
         return f"{kb / 1_048_576:.1f} GB"
     if kb >= 1_024:
@@ -39,28 +57,33 @@ def format_size(kb: int | None) -> str:
     return f"{kb:,} KB"
 
 
+_SEVERITY_COLORS: dict[str, str] = {
+    "CRITICAL": "bold red",
+    "HIGH": "red",
+    "MEDIUM": "yellow",
+    "LOW": "cyan",
+    "INFO": "dim",
+}
+
+_SEVERITY_EMOJIS: dict[str, str] = {
+    "CRITICAL": "\U0001f534",
+    "HIGH": "\U0001f7e0",
+    "MEDIUM": "\U0001f7e1",
+    "LOW": "\U0001f7e2",
+    "INFO": "\u2139\ufe0f",
+}
+
+
 def severity_color(severity: str) -> str:
     """Return Rich color name for severity level."""
-    colors = {
-        "CRITICAL": "bold red",
-        "HIGH": "red",
-        "MEDIUM": "yellow",
-        "LOW": "cyan",
-        "INFO": "dim",
-    }
-    return colors.get(severity.upper(), "white")
+    # Callers almost always pass the canonical uppercase label; only fall
+    # back to upper() for anything else
+    return _SEVERITY_COLORS.get(severity) or _SEVERITY_COLORS.get(severity.upper(), "white")
 
 
 def severity_emoji(severity: str) -> str:
     """Return emoji indicator for severity level."""
-    emojis = {
-        "CRITICAL": "\U0001f534",
-        "HIGH": "\U0001f7e0",
-        "MEDIUM": "\U0001f7e1",
-        "LOW": "\U0001f7e2",
-        "INFO": "\u2139\ufe0f",
-    }
-    return emojis.get(severity.upper(), "")
+    return _SEVERITY_EMOJIS.get(severity) or _SEVERITY_EMOJIS.get(severity.upper(), "")
 
 
 def risk_label(score: float) -> str:
@@ -138,6 +161,27 @@ def build_create_index_sql(
     Returns:
         CREATE INDEX statement string.
     """
+    return _create_index_sql(
+        table_name,
+        tuple(columns),
+        tuple(include_columns) if include_columns else None,
+        index_name,
+        provider,
+    )
+
+
+@functools.lru_cache(maxsize=2048)
+def _create_index_sql(
+    table_name: str,
+    columns: tuple[str, ...],
+    include_columns: tuple[str, ...] | None,
+    index_name: str | None,
+    provider: str,
+) -> str:
+    """Memoized, tuple-argument form of :func:`build_create_index_sql`.
+
+    DMV recommendations often repeat the same (table, columns) signature.
+    """
     if not index_name:
         col_suffix = "_".join(columns)[:40]
         index_name = f"IX_{table_name}_{col_suffix}"
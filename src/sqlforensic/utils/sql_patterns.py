@@ -1,16 +1,24 @@
 """Regex patterns for SQL analysis.
 
-All patterns are pre-compiled or stored as raw strings for use with
-re.compile/re.findall/re.search with appropriate flags.
+Each pattern is stored as a raw string (``*_PATTERN``) for use with
+re.compile/re.findall/re.search with appropriate flags. The ones used for
+SQL body scanning are also exported pre-compiled with ``re.IGNORECASE``
+(``*_RE``), as is the case-sensitive FK naming pattern, so hot loops can
+call e.g. ``JOIN_RE.finditer(body)`` without going through the ``re``
+module cache on every call.
 """
 
 from __future__ import annotations
 
+import re
+
 # Table references in FROM clauses (captures schema.table or table)
 TABLE_REF_PATTERN = r"(?:FROM|INTO|UPDATE)\s+(?:\[?(\w+)\]?\.)?(\[?\w+\]?)"
 
-# JOIN patterns (all join types)
-JOIN_PATTERN = r"(?:INNER|LEFT|RIGHT|FULL|CROSS)?\s*JOIN\s+(?:\[?(\w+)\]?\.)?(\[?\w+\]?)"
+# JOIN patterns (all join types). The whitespace sits inside the optional
+# join-type group so a match can only start at a keyword; a bare leading \s*
+# made every position of a long whitespace run re-scan the run (quadratic).
+JOIN_PATTERN = r"(?:(?:INNER|LEFT|RIGHT|FULL|CROSS)\s*)?JOIN\s+(?:\[?(\w+)\]?\.)?(\[?\w+\]?)"
 
 # SELECT ... FROM table
 SELECT_FROM_PATTERN = r"FROM\s+(?:\[?\w+\]?\.)?\[?(\w+)\]?"
@@ -50,3 +58,22 @@ FK_NAMING_PATTERN = r"(\w+)(?:Id|_id|ID)$"
 
 # Schema-qualified name
 SCHEMA_QUALIFIED_PATTERN = r"\[?(\w+)\]?\.\[?(\w+)\]?"
+
+# Pre-compiled, case-insensitive forms of the body-scanning patterns above
+TABLE_REF_RE = re.compile(TABLE_REF_PATTERN, re.IGNORECASE)
+JOIN_RE = re.compile(JOIN_PATTERN, re.IGNORECASE)
+SELECT_FROM_RE = re.compile(SELECT_FROM_PATTERN, re.IGNORECASE)
+INSERT_RE = re.compile(INSERT_PATTERN, re.IGNORECASE)
+UPDATE_RE = re.compile(UPDATE_PATTERN, re.IGNORECASE)
+DELETE_RE = re.compile(DELETE_PATTERN, re.IGNORECASE)
+SUBQUERY_RE = re.compile(SUBQUERY_PATTERN, re.IGNORECASE)
+CURSOR_RE = re.compile(CURSOR_PATTERN, re.IGNORECASE)
+DYNAMIC_SQL_RE = re.compile(DYNAMIC_SQL_PATTERN, re.IGNORECASE)
+TEMP_TABLE_RE = re.compile(TEMP_TABLE_PATTERN, re.IGNORECASE)
+CASE_RE = re.compile(CASE_PATTERN, re.IGNORECASE)
+SELECT_STAR_RE = re.compile(SELECT_STAR_PATTERN, re.IGNORECASE)
+NOLOCK_RE = re.compile(NOLOCK_PATTERN, re.IGNORECASE)
+SCHEMA_QUALIFIED_RE = re.compile(SCHEMA_QUALIFIED_PATTERN, re.IGNORECASE)
+
+# Column-name suffixes are matched case-sensitively (Id/_id/ID, not "iD")
+FK_NAMING_RE = re.compile(FK_NAMING_PATTERN)
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import dataclasses
+from collections.abc import Callable
+from typing import Any
 
 import pytest
 
 from sqlforensic import AnalysisReport
 from sqlforensic.config import ConnectionConfig
+from sqlforensic.connectors.base import BaseConnector
 
+# The shared fixtures below are built once per session and handed to every
+# test that asks for them: tests must treat them as read-only.
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def connection_config() -> ConnectionConfig:
     """Standard SQL Server connection config."""
     return ConnectionConfig(
@@ -23,28 +29,66 @@ def connection_config() -> ConnectionConfig:
     )
 
 
-@pytest.fixture
-def mock_connector(connection_config: ConnectionConfig) -> MagicMock:
-    """Mock connector with SchoolDB data pre-loaded."""
-    connector = MagicMock()
-    connector.config = connection_config
-    connector.is_connected = True
+class FakeConnector(BaseConnector):
+    """Connected, read-only connector serving the SchoolDB mock data.
+
+    A plain class rather than a MagicMock: analyzers call these methods many
+    times, and a stub skips the mock call recording and child-mock creation.
+    """
+
+    def __init__(self, config: ConnectionConfig) -> None:
+        super().__init__(config)
+        self._connection = object()  # reports is_connected without a real driver
+
+    def connect(self) -> None:
+        pass
+
+    def disconnect(self) -> None:
+        pass
+
+    def execute_query(
+        self, query: str, params: tuple[Any, ...] | None = None
+    ) -> list[dict[str, Any]]:
+        return []
+
+    def get_tables(self) -> list[dict[str, Any]]:
+        return MOCK_TABLES
+
+    def get_columns(self, table_schema: str, table_name: str) -> list[dict[str, Any]]:
+        return _mock_get_columns(table_schema, table_name)
+
+    def get_foreign_keys(self) -> list[dict[str, Any]]:
+        return MOCK_FOREIGN_KEYS
+
+    def get_stored_procedures(self) -> list[dict[str, Any]]:
+        return MOCK_STORED_PROCEDURES
+
+    def get_views(self) -> list[dict[str, Any]]:
+        return MOCK_VIEWS
+
+    def get_functions(self) -> list[dict[str, Any]]:
+        return MOCK_FUNCTIONS
+
+    def get_indexes(self) -> list[dict[str, Any]]:
+        return MOCK_INDEXES
+
+    def get_missing_indexes(self) -> list[dict[str, Any]]:
+        return MOCK_MISSING_INDEXES
+
+    def get_table_sizes(self) -> list[dict[str, Any]]:
+        return MOCK_TABLE_SIZES
+
+    def get_permissions(self) -> list[dict[str, Any]]:
+        return MOCK_PERMISSIONS
 
-    connector.get_tables.return_value = MOCK_TABLES
-    connector.get_columns.side_effect = _mock_get_columns
-    connector.get_foreign_keys.return_value = MOCK_FOREIGN_KEYS
-    connector.get_stored_procedures.return_value = MOCK_STORED_PROCEDURES
-    connector.get_views.return_value = MOCK_VIEWS
-    connector.get_functions.return_value = MOCK_FUNCTIONS
-    connector.get_indexes.return_value = MOCK_INDEXES
-    connector.get_missing_indexes.return_value = MOCK_MISSING_INDEXES
-    connector.get_table_sizes.return_value = MOCK_TABLE_SIZES
-    connector.get_permissions.return_value = MOCK_PERMISSIONS
 
-    return connector
+@pytest.fixture(scope="session")
+def mock_connector(connection_config: ConnectionConfig) -> BaseConnector:
+    """Connector with SchoolDB data pre-loaded."""
+    return FakeConnector(connection_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tables() -> list[dict]:
     """Tables with column data embedded."""
     tables = []
@@ -63,7 +107,7 @@ def sample_tables() -> list[dict]:
     return tables
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_report(sample_tables: list[dict]) -> AnalysisReport:
     """Pre-built AnalysisReport for testing scorers and reporters."""
     return AnalysisReport(
@@ -278,305 +322,320 @@ def sample_report(sample_tables: list[dict]) -> AnalysisReport:
     )
 
 
+@pytest.fixture(scope="session")
+def report_factory(sample_report: AnalysisReport) -> Callable[..., AnalysisReport]:
+    """Build variants of sample_report with some fields overridden.
+
+    Unchanged fields are shared with sample_report (not copied), so the
+    variants are read-only too; pass a new value for anything to change.
+    """
+
+    def make_report(**overrides: Any) -> AnalysisReport:
+        return dataclasses.replace(sample_report, **overrides)
+
+    return make_report
+
+
 def _mock_get_columns(table_schema: str, table_name: str) -> list[dict]:
-    """Return mock columns for a given table."""
-    columns_map = {
-        "Students": [
-            {
-                "COLUMN_NAME": "Id",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 1,
-                "is_primary_key": 1,
-            },
-            {
-                "COLUMN_NAME": "FirstName",
-                "DATA_TYPE": "varchar",
-                "CHARACTER_MAXIMUM_LENGTH": 100,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 2,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "LastName",
-                "DATA_TYPE": "varchar",
-                "CHARACTER_MAXIMUM_LENGTH": 100,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 3,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "Email",
-                "DATA_TYPE": "varchar",
-                "CHARACTER_MAXIMUM_LENGTH": 255,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 4,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "EnrollmentDate",
-                "DATA_TYPE": "datetime",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": "GETDATE()",
-                "ORDINAL_POSITION": 5,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "DepartmentId",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 6,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "MiddleName",
-                "DATA_TYPE": "varchar",
-                "CHARACTER_MAXIMUM_LENGTH": 100,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 7,
-                "is_primary_key": 0,
-            },
-        ],
-        "Courses": [
-            {
-                "COLUMN_NAME": "Id",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 1,
-                "is_primary_key": 1,
-            },
-            {
-                "COLUMN_NAME": "CourseName",
-                "DATA_TYPE": "varchar",
-                "CHARACTER_MAXIMUM_LENGTH": 200,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 2,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "Credits",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": "3",
-                "ORDINAL_POSITION": 3,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "DepartmentId",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 4,
-                "is_primary_key": 0,
-            },
-        ],
-        "Enrollments": [
-            {
-                "COLUMN_NAME": "Id",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 1,
-                "is_primary_key": 1,
-            },
-            {
-                "COLUMN_NAME": "StudentId",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 2,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "CourseId",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 3,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "EnrollDate",
-                "DATA_TYPE": "datetime",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 4,
-                "is_primary_key": 0,
-            },
-        ],
-        "Grades": [
-            {
-                "COLUMN_NAME": "Id",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 1,
-                "is_primary_key": 1,
-            },
-            {
-                "COLUMN_NAME": "StudentId",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 2,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "CourseId",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 3,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "Grade",
-                "DATA_TYPE": "decimal",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 4,
-                "is_primary_key": 0,
-            },
-        ],
-        "Payments": [
-            {
-                "COLUMN_NAME": "Id",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 1,
-                "is_primary_key": 1,
-            },
-            {
-                "COLUMN_NAME": "StudentId",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 2,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "Amount",
-                "DATA_TYPE": "decimal",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 3,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "PaymentDate",
-                "DATA_TYPE": "datetime",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 4,
-                "is_primary_key": 0,
-            },
-        ],
-        "Departments": [
-            {
-                "COLUMN_NAME": "Id",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 1,
-                "is_primary_key": 1,
-            },
-            {
-                "COLUMN_NAME": "DepartmentName",
-                "DATA_TYPE": "varchar",
-                "CHARACTER_MAXIMUM_LENGTH": 200,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 2,
-                "is_primary_key": 0,
-            },
-        ],
-        "AuditLog": [
-            {
-                "COLUMN_NAME": "Id",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 1,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "Action",
-                "DATA_TYPE": "varchar",
-                "CHARACTER_MAXIMUM_LENGTH": 500,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 2,
-                "is_primary_key": 0,
-            },
-        ],
-        "Logs_Archive": [
-            {
-                "COLUMN_NAME": "Id",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 1,
-                "is_primary_key": 0,
-            },
-            {
-                "COLUMN_NAME": "Message",
-                "DATA_TYPE": "varchar",
-                "CHARACTER_MAXIMUM_LENGTH": 4000,
-                "IS_NULLABLE": "YES",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 2,
-                "is_primary_key": 0,
-            },
-        ],
-    }
-    return columns_map.get(
-        table_name,
-        [
-            {
-                "COLUMN_NAME": "Id",
-                "DATA_TYPE": "int",
-                "CHARACTER_MAXIMUM_LENGTH": None,
-                "IS_NULLABLE": "NO",
-                "COLUMN_DEFAULT": None,
-                "ORDINAL_POSITION": 1,
-                "is_primary_key": 1,
-            },
-        ],
-    )
+    """Return mock columns for a given table (shared lists: do not mutate)."""
+    return MOCK_COLUMNS.get(table_name, MOCK_DEFAULT_COLUMNS)
 
 
 # ── Mock Data ──────────────────────────────────────────────────────
 
+MOCK_COLUMNS = {
+    "Students": [
+        {
+            "COLUMN_NAME": "Id",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 1,
+            "is_primary_key": 1,
+        },
+        {
+            "COLUMN_NAME": "FirstName",
+            "DATA_TYPE": "varchar",
+            "CHARACTER_MAXIMUM_LENGTH": 100,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 2,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "LastName",
+            "DATA_TYPE": "varchar",
+            "CHARACTER_MAXIMUM_LENGTH": 100,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 3,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "Email",
+            "DATA_TYPE": "varchar",
+            "CHARACTER_MAXIMUM_LENGTH": 255,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 4,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "EnrollmentDate",
+            "DATA_TYPE": "datetime",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": "GETDATE()",
+            "ORDINAL_POSITION": 5,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "DepartmentId",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 6,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "MiddleName",
+            "DATA_TYPE": "varchar",
+            "CHARACTER_MAXIMUM_LENGTH": 100,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 7,
+            "is_primary_key": 0,
+        },
+    ],
+    "Courses": [
+        {
+            "COLUMN_NAME": "Id",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 1,
+            "is_primary_key": 1,
+        },
+        {
+            "COLUMN_NAME": "CourseName",
+            "DATA_TYPE": "varchar",
+            "CHARACTER_MAXIMUM_LENGTH": 200,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 2,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "Credits",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": "3",
+            "ORDINAL_POSITION": 3,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "DepartmentId",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 4,
+            "is_primary_key": 0,
+        },
+    ],
+    "Enrollments": [
+        {
+            "COLUMN_NAME": "Id",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 1,
+            "is_primary_key": 1,
+        },
+        {
+            "COLUMN_NAME": "StudentId",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 2,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "CourseId",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 3,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "EnrollDate",
+            "DATA_TYPE": "datetime",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 4,
+            "is_primary_key": 0,
+        },
+    ],
+    "Grades": [
+        {
+            "COLUMN_NAME": "Id",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 1,
+            "is_primary_key": 1,
+        },
+        {
+            "COLUMN_NAME": "StudentId",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 2,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "CourseId",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 3,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "Grade",
+            "DATA_TYPE": "decimal",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 4,
+            "is_primary_key": 0,
+        },
+    ],
+    "Payments": [
+        {
+            "COLUMN_NAME": "Id",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 1,
+            "is_primary_key": 1,
+        },
+        {
+            "COLUMN_NAME": "StudentId",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 2,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "Amount",
+            "DATA_TYPE": "decimal",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 3,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "PaymentDate",
+            "DATA_TYPE": "datetime",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 4,
+            "is_primary_key": 0,
+        },
+    ],
+    "Departments": [
+        {
+            "COLUMN_NAME": "Id",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 1,
+            "is_primary_key": 1,
+        },
+        {
+            "COLUMN_NAME": "DepartmentName",
+            "DATA_TYPE": "varchar",
+            "CHARACTER_MAXIMUM_LENGTH": 200,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 2,
+            "is_primary_key": 0,
+        },
+    ],
+    "AuditLog": [
+        {
+            "COLUMN_NAME": "Id",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 1,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "Action",
+            "DATA_TYPE": "varchar",
+            "CHARACTER_MAXIMUM_LENGTH": 500,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 2,
+            "is_primary_key": 0,
+        },
+    ],
+    "Logs_Archive": [
+        {
+            "COLUMN_NAME": "Id",
+            "DATA_TYPE": "int",
+            "CHARACTER_MAXIMUM_LENGTH": None,
+            "IS_NULLABLE": "NO",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 1,
+            "is_primary_key": 0,
+        },
+        {
+            "COLUMN_NAME": "Message",
+            "DATA_TYPE": "varchar",
+            "CHARACTER_MAXIMUM_LENGTH": 4000,
+            "IS_NULLABLE": "YES",
+            "COLUMN_DEFAULT": None,
+            "ORDINAL_POSITION": 2,
+            "is_primary_key": 0,
+        },
+    ],
+}
+
+# Columns for any table not listed in MOCK_COLUMNS
+MOCK_DEFAULT_COLUMNS = [
+    {
+        "COLUMN_NAME": "Id",
+        "DATA_TYPE": "int",
+        "CHARACTER_MAXIMUM_LENGTH": None,
+        "IS_NULLABLE": "NO",
+        "COLUMN_DEFAULT": None,
+        "ORDINAL_POSITION": 1,
+        "is_primary_key": 1,
+    },
+]
+
 MOCK_TABLES = [
     {"TABLE_SCHEMA": "dbo", "TABLE_NAME": "Students", "row_count": 15000},
     {"TABLE_SCHEMA": "dbo", "TABLE_NAME": "Courses", "row_count": 200},
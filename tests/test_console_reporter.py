@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from io import StringIO
 
 from rich.console import Console
@@ -69,3 +70,15 @@ class TestConsoleReporter:
         )
         output = _capture_output(report)
         assert "Hotspots" not in output
+
+    def test_full_report_without_issues_skips_only_issues_table(
+        self, report_factory: Callable[..., AnalysisReport]
+    ) -> None:
+        output = _capture_output(report_factory(issues=[]))
+        assert "Issues Found" not in output
+        assert "Hotspots" in output
+
+    def test_default_console_is_shared(self, sample_report: AnalysisReport) -> None:
+        first = ConsoleReporter(sample_report)
+        second = ConsoleReporter(sample_report)
+        assert first.console is second.console
@@ -37,6 +37,12 @@ class TestFormatRowCount:
     def test_exact_thousand(self) -> None:
         assert format_row_count(1_000) == "1.0K"
 
+    def test_cached_values_keep_their_type(self) -> None:
+        assert format_row_count(12) == "12"
+        assert format_row_count(12.0) == "12.0"  # type: ignore[arg-type]
+        assert format_size(12.0) == "12.0 KB"  # type: ignore[arg-type]
+        assert format_size(12) == "12 KB"
+
 
 class TestFormatSize:
     def test_none_returns_na(self) -> None:
@@ -85,6 +91,9 @@ class TestSeverityEmoji:
     def test_unknown_returns_empty(self) -> None:
         assert severity_emoji("UNKNOWN") == ""
 
+    def test_case_insensitive(self) -> None:
+        assert severity_emoji("medium") == severity_emoji("MEDIUM") != ""
+
 
 class TestRiskLabel:
     def test_critical(self) -> None:
@@ -178,6 +187,14 @@ class TestBuildCreateIndexSQL:
         sql = build_create_index_sql("Orders", ["CustomerId"])
         assert "IX_Orders_CustomerId" in sql
 
+    def test_repeated_calls_ignore_argument_container(self) -> None:
+        cols = ["CustomerId"]
+        first = build_create_index_sql("Orders", cols, include_columns=[])
+        cols.append("OrderDate")
+        assert build_create_index_sql("Orders", ["CustomerId"]) == first
+        assert "OrderDate" in build_create_index_sql("Orders", cols)
+        assert "INCLUDE" not in first
+
 
 class TestBuildDropIndexSQL:
     def test_drop_index(self) -> None:
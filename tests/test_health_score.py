@@ -95,3 +95,29 @@ class TestHealthScoreCalculator:
             assert required_keys.issubset(issue.keys()), (
                 f"Issue missing keys: {required_keys - issue.keys()}"
             )
+
+    def test_table_gap_counts(self) -> None:
+        """PK and index gaps are counted independently per table."""
+        report = AnalysisReport(
+            database="GapsDB",
+            tables=[
+                {"TABLE_NAME": "NoPk", "columns": [{"is_primary_key": False}]},
+                {"TABLE_NAME": "NoColumns"},
+                {"TABLE_NAME": "Fine", "columns": [{"is_primary_key": True}]},
+            ],
+            indexes=[{"table_name": "NoPk"}, {"table_name": "Fine"}],
+        )
+        calc = HealthScoreCalculator(report)
+
+        assert calc.calculate() == 90
+        counts = {issue["description"]: issue["count"] for issue in calc.get_issues()}
+        assert counts == {"Tables with no primary key": 1, "Tables with no indexes": 1}
+
+    def test_get_issues_returns_a_copy(self, sample_report: AnalysisReport) -> None:
+        """Mutating the returned list should not affect later get_issues() calls."""
+        calc = HealthScoreCalculator(sample_report)
+        calc.calculate()
+        first = calc.get_issues()
+        first.clear()
+
+        assert calc.get_issues()
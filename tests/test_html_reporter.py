@@ -86,3 +86,36 @@ class TestHTMLReporter:
         assert "links" in data
         assert isinstance(data["nodes"], list)
         assert isinstance(data["links"], list)
+
+    def test_env_and_assets_shared_across_instances(self, sample_report: AnalysisReport) -> None:
+        """Reporters should share one Jinja environment and read each asset only once."""
+        first = HTMLReporter(sample_report)
+        second = HTMLReporter(sample_report)
+
+        assert first.env is second.env
+        css = first._load_asset("assets/style.css")
+        assert css
+        assert second._load_asset("assets/style.css") is css
+
+    def test_export_matches_rendered_template(self, sample_report: AnalysisReport) -> None:
+        """Streaming export() should write exactly what a full render produces."""
+        import re
+
+        reporter = HTMLReporter(sample_report)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "report.html")
+            reporter.export(output_path)
+
+            with open(output_path, encoding="utf-8") as f:
+                html = f.read()
+
+        expected = reporter.env.get_template("report.html").render(
+            report=sample_report,
+            generated_at="2000-01-01 00:00:00",
+            graph_data=reporter._build_graph_json(),
+            css=reporter._load_asset("assets/style.css"),
+            graph_js=reporter._load_asset("assets/graph.js"),
+        )
+        timestamp = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+        assert timestamp.sub("", html) == timestamp.sub("", expected)
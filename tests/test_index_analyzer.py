@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 from sqlforensic.analyzers.index_analyzer import IndexAnalyzer
+from sqlforensic.connectors.base import BaseConnector
 
 
 class TestIndexAnalyzer:
     """Tests for index analysis and recommendations."""
 
-    def test_analyze_returns_all_expected_keys(self, mock_connector: MagicMock) -> None:
+    def test_analyze_returns_all_expected_keys(self, mock_connector: BaseConnector) -> None:
         """analyze() returns missing, unused, duplicates, recommendations."""
         analyzer = IndexAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -18,7 +17,7 @@ class TestIndexAnalyzer:
         expected_keys = {"all", "missing", "unused", "duplicates", "overlapping", "recommendations"}
         assert expected_keys == set(result.keys())
 
-    def test_missing_indexes_detected(self, mock_connector: MagicMock) -> None:
+    def test_missing_indexes_detected(self, mock_connector: BaseConnector) -> None:
         """Missing indexes from DMV data should be returned with create SQL."""
         analyzer = IndexAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -34,7 +33,7 @@ class TestIndexAnalyzer:
             assert "create_sql" in idx
             assert idx["create_sql"].startswith("CREATE INDEX")
 
-    def test_unused_indexes_detected(self, mock_connector: MagicMock) -> None:
+    def test_unused_indexes_detected(self, mock_connector: BaseConnector) -> None:
         """Indexes with 0 seeks, scans, and lookups (and not PK/unique) should be unused."""
         analyzer = IndexAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -48,7 +47,7 @@ class TestIndexAnalyzer:
             assert "drop_sql" in idx
             assert idx["drop_sql"].startswith("DROP INDEX")
 
-    def test_duplicate_indexes_detected(self, mock_connector: MagicMock) -> None:
+    def test_duplicate_indexes_detected(self, mock_connector: BaseConnector) -> None:
         """Indexes covering the same columns on the same table should be flagged as duplicates."""
         analyzer = IndexAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -62,7 +61,7 @@ class TestIndexAnalyzer:
             assert "duplicate_of" in dup
             assert "drop_sql" in dup
 
-    def test_recommendations_generated(self, mock_connector: MagicMock) -> None:
+    def test_recommendations_generated(self, mock_connector: BaseConnector) -> None:
         """Recommendations should include CREATE for missing and DROP for duplicates/unused."""
         analyzer = IndexAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -74,7 +73,7 @@ class TestIndexAnalyzer:
         assert "CREATE" in actions
         assert "DROP" in actions
 
-    def test_pk_and_unique_indexes_not_flagged_unused(self, mock_connector: MagicMock) -> None:
+    def test_pk_and_unique_indexes_not_flagged_unused(self, mock_connector: BaseConnector) -> None:
         """Primary key and unique indexes should never appear in unused list."""
         analyzer = IndexAnalyzer(mock_connector)
         result = analyzer.analyze()
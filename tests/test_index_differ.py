@@ -0,0 +1,49 @@
+"""Tests for index_differ.py — index diff logic."""
+
+from __future__ import annotations
+
+from sqlforensic.diff.index_differ import diff_indexes
+
+
+def _idx(name: str, columns: str, table: str = "Orders", schema: str = "dbo") -> dict:
+    return {
+        "table_schema": schema,
+        "table_name": table,
+        "index_name": name,
+        "index_type": "NONCLUSTERED",
+        "columns": columns,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestIndexDiffer:
+    """Tests for diff_indexes."""
+
+    def test_identical_indexes(self) -> None:
+        """Identical index lists should produce an empty IndexDiff."""
+        indexes = [_idx("IX_A", "A"), _idx("IX_B", "B")]
+
+        result = diff_indexes(indexes, indexes)
+
+        assert result.added_indexes == []
+        assert result.removed_indexes == []
+        assert result.modified_indexes == []
+
+    def test_added_removed_and_modified(self) -> None:
+        """Indexes are classified by key and reported in sorted key order."""
+        source = [_idx("IX_C", "C"), _idx("IX_A", "A"), _idx("IX_Shared", "X, Y")]
+        target = [_idx("IX_Shared", "X"), _idx("IX_Old", "O")]
+
+        result = diff_indexes(source, target)
+
+        assert [i.index_name for i in result.added_indexes] == ["IX_A", "IX_C"]
+        assert [i.index_name for i in result.removed_indexes] == ["IX_Old"]
+        assert len(result.modified_indexes) == 1
+        mod = result.modified_indexes[0]
+        assert mod.index_name == "IX_Shared"
+        assert mod.old_columns == "X"
+        assert mod.new_columns == "X, Y"
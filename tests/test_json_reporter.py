@@ -5,8 +5,14 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
 
 from sqlforensic import AnalysisReport, __version__
+from sqlforensic.diff.diff_result import ColumnInfo
 from sqlforensic.reporters.json_reporter import JSONReporter
 
 
@@ -108,3 +114,66 @@ class TestJSONReporter:
             assert "implicit" in data["relationships"]
         finally:
             os.unlink(path)
+
+    def test_orjson_and_stdlib_output_match(
+        self, report_factory: Callable[..., AnalysisReport]
+    ) -> None:
+        pytest.importorskip("orjson")
+        # Values json cannot encode natively go through default=str on both paths
+        report = report_factory(
+            size_info=[
+                {
+                    "last_growth": datetime(2024, 1, 15, 9, 30),
+                    "largest_column": ColumnInfo(name="Body", data_type="nvarchar"),
+                    "rows_by_year": {2023: 1200, 2024: 1500},
+                }
+            ]
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fast_path = os.path.join(tmpdir, "fast.json")
+            std_path = os.path.join(tmpdir, "std.json")
+            JSONReporter(report).export(fast_path)
+            with patch("sqlforensic.reporters.json_reporter._HAS_ORJSON", False):
+                JSONReporter(report).export(std_path)
+
+            with open(fast_path, encoding="utf-8") as f:
+                fast = json.load(f)
+            with open(std_path, encoding="utf-8") as f:
+                std = json.load(f)
+
+        fast["metadata"].pop("generated_at")
+        std["metadata"].pop("generated_at")
+        assert fast == std
+        row = fast["size_info"][0]
+        assert row["last_growth"] == "2024-01-15 09:30:00"
+        assert row["largest_column"].startswith("ColumnInfo(name='Body'")
+        assert row["rows_by_year"] == {"2023": 1200, "2024": 1500}
+
+    def test_compact_export_drops_empty_sections(self) -> None:
+        report = AnalysisReport(
+            database="CompactDB",
+            tables=[{"TABLE_NAME": "Users"}],
+            missing_indexes=[{"table_name": "Users"}],
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "compact.json")
+            JSONReporter(report).export(path, compact=True)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+
+        assert data["metadata"]["compact"] is True
+        assert data["health_score"] == 0
+        assert data["tables"] == [{"TABLE_NAME": "Users"}]
+        assert data["indexes"] == {"missing": [{"table_name": "Users"}]}
+        assert "views" not in data
+        assert "dead_code" not in data
+
+    def test_generated_at_is_utc(self, sample_report: AnalysisReport) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "report.json")
+            JSONReporter(sample_report).export(path)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+
+        generated_at = datetime.fromisoformat(data["metadata"]["generated_at"])
+        assert generated_at.utcoffset() == timedelta(0)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 from sqlforensic.diff.diff_result import (
     ColumnInfo,
     ColumnModification,
@@ -301,3 +303,49 @@ class TestMigrationGenerator:
         assert "RISK [CRITICAL]" in script
         assert "Breaking:" in script
         assert "CriticalTable" in script
+
+    def test_generate_to_streams_same_script(self) -> None:
+        """generate_to() should write the same script generate() returns."""
+        diff = _empty_diff(
+            tables=TableDiff(
+                added_tables=[
+                    TableInfo(
+                        schema="dbo",
+                        name="Products",
+                        columns=[ColumnInfo(name="Id", data_type="int", is_primary_key=True)],
+                    ),
+                ],
+            ),
+        )
+        gen = MigrationGenerator(diff, provider="postgresql", safe_mode=True)
+        buf = io.StringIO()
+        line_count = gen.generate_to(buf)
+        streamed = buf.getvalue()
+
+        # Only the generation timestamp may differ between the two runs
+        def strip_ts(text: str) -> str:
+            return "\n".join(ln for ln in text.splitlines() if "Generated:" not in ln)
+
+        assert strip_ts(streamed) == strip_ts(gen.generate())
+        assert line_count == streamed.count("\n")
+
+    def test_modify_step_skipped_when_nothing_to_emit(self) -> None:
+        """A modify-columns step with no actionable changes should not emit a header."""
+        diff = _empty_diff(
+            tables=TableDiff(
+                modified_tables=[
+                    TableModification(
+                        table_name="Users",
+                        table_schema="dbo",
+                        modified_columns=[
+                            ColumnModification(column_name="Status", change_type="unknown"),
+                        ],
+                    ),
+                ],
+            ),
+        )
+        gen = MigrationGenerator(diff, provider="sqlserver", safe_mode=True)
+        script = gen.generate()
+
+        assert "Step 1:" not in script
+        assert "Modify existing columns" not in script
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 from sqlforensic.analyzers.relationship_analyzer import RelationshipAnalyzer
+from sqlforensic.connectors.base import BaseConnector
 
 
 class TestRelationshipAnalyzer:
@@ -12,7 +11,7 @@ class TestRelationshipAnalyzer:
 
     def test_explicit_fk_relationships_returned(
         self,
-        mock_connector: MagicMock,
+        mock_connector: BaseConnector,
         sample_tables: list[dict],
     ) -> None:
         """analyze() should return all foreign keys from the connector."""
@@ -29,7 +28,7 @@ class TestRelationshipAnalyzer:
 
     def test_implicit_relationships_discovered(
         self,
-        mock_connector: MagicMock,
+        mock_connector: BaseConnector,
         sample_tables: list[dict],
     ) -> None:
         """Implicit relationships should be found from SP JOINs and naming conventions."""
@@ -43,7 +42,7 @@ class TestRelationshipAnalyzer:
 
     def test_implicit_relationships_have_confidence(
         self,
-        mock_connector: MagicMock,
+        mock_connector: BaseConnector,
         sample_tables: list[dict],
     ) -> None:
         """Each implicit relationship must have a confidence score and source."""
@@ -59,7 +58,7 @@ class TestRelationshipAnalyzer:
 
     def test_deduplication_removes_fk_duplicates(
         self,
-        mock_connector: MagicMock,
+        mock_connector: BaseConnector,
         sample_tables: list[dict],
     ) -> None:
         """Implicit relationships that duplicate explicit FKs should be removed."""
@@ -80,7 +79,7 @@ class TestRelationshipAnalyzer:
 
     def test_naming_convention_detects_payment_student_link(
         self,
-        mock_connector: MagicMock,
+        mock_connector: BaseConnector,
         sample_tables: list[dict],
     ) -> None:
         """Payments.StudentId detected as implicit FK to Students."""
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+from sqlforensic.diff import risk_assessor
 from sqlforensic.diff.diff_result import (
     ColumnInfo,
     ColumnModification,
@@ -347,3 +350,52 @@ class TestRiskAssessor:
         assessor = _make_assessor()
         risks = assessor.assess(diff)
         assert risks == []
+
+    def test_column_dependents_whole_word_match(self) -> None:
+        """Column dependents match whole words only, case-insensitively."""
+        assessor = RiskAssessor(
+            stored_procedures=[
+                {
+                    "ROUTINE_NAME": "sp_Exact",
+                    "ROUTINE_DEFINITION": "select email from STUDENTS",
+                },
+                {
+                    "ROUTINE_NAME": "sp_Prefix",
+                    "ROUTINE_DEFINITION": "SELECT EmailVerified FROM Students",
+                },
+            ],
+            views=[],
+            foreign_keys=[],
+        )
+        diff = _empty_diff(
+            tables=TableDiff(
+                modified_tables=[
+                    TableModification(
+                        table_name="Students",
+                        table_schema="dbo",
+                        removed_columns=[ColumnInfo(name="Email", data_type="varchar")],
+                    ),
+                ],
+            ),
+        )
+        (risk,) = assessor.assess(diff)
+        assert risk.affected_objects == ["SP:sp_Exact"]
+
+    def test_dependent_lookups_memoized(self) -> None:
+        """Repeated lookups reuse cached results but hand out independent lists."""
+        assessor = _make_assessor()
+        first = assessor._find_dependents("Students")
+        first.append("SP:mutated")
+        second = assessor._find_dependents("Students")
+        assert "SP:mutated" not in second
+        assert ("table", "Students") in assessor._dep_cache
+
+    def test_bodies_not_indexed_without_lookups(self) -> None:
+        """A diff with nothing to look up should not normalize or tokenize any body."""
+        with (
+            patch.object(risk_assessor, "_fold", wraps=risk_assessor._fold) as fold,
+            patch.object(risk_assessor, "_WORD_RE", wraps=risk_assessor._WORD_RE) as word_re,
+        ):
+            assert _make_assessor().assess(_empty_diff()) == []
+        fold.assert_not_called()
+        assert word_re.mock_calls == []
@@ -91,3 +91,52 @@ class TestRiskScorer:
         assert RiskScorer._size_risk(100_000) == 10
         assert RiskScorer._size_risk(1_000_000) == 15
         assert RiskScorer._size_risk(10_000_000) == 20
+
+    def test_fk_dependency_count_per_table(self) -> None:
+        """Each table should count only the relationships that reference it."""
+        report = AnalysisReport(
+            database="FKDB",
+            tables=[{"TABLE_NAME": "Customers"}, {"TABLE_NAME": "Orders"}],
+            relationships=[
+                {"referenced_table": "Customers"},
+                {"referenced_table": "Customers"},
+                {"referenced_table": "Orders"},
+            ],
+        )
+        result = RiskScorer(report).calculate()
+
+        counts = {t["name"]: t["fk_dependency_count"] for t in result["tables"]}
+        assert counts == {"Customers": 2, "Orders": 1}
+
+    def test_complexity_counts_each_dependent_sp_once(self) -> None:
+        """An SP referencing a table twice should add its complexity only once."""
+        report = AnalysisReport(
+            database="CxDB",
+            tables=[{"TABLE_NAME": "Orders"}],
+            sp_analysis=[
+                {"name": "sp_A", "complexity_score": 50, "referenced_tables": ["Orders", "Orders"]},
+                {"name": "sp_B", "complexity_score": 30, "referenced_tables": ["Orders"]},
+                {"name": "sp_C", "complexity_score": 90, "referenced_tables": []},
+            ],
+        )
+        table = RiskScorer(report).calculate()["tables"][0]
+
+        # 3 dependent entries * 5 + (50 + 30) // 5
+        assert table["risk_score"] == 15 + 16
+
+    def test_risk_level_thresholds(self) -> None:
+        """Risk levels switch at 20/40/60/80, matching the report labels."""
+        expected = {
+            0: "MINIMAL",
+            19: "MINIMAL",
+            20: "LOW",
+            39: "LOW",
+            40: "MEDIUM",
+            59: "MEDIUM",
+            60: "HIGH",
+            79: "HIGH",
+            80: "CRITICAL",
+            100: "CRITICAL",
+        }
+        for score, label in expected.items():
+            assert RiskScorer._risk_level(score) == label
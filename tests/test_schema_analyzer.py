@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 from sqlforensic.analyzers.schema_analyzer import SchemaAnalyzer
+from sqlforensic.connectors.base import BaseConnector
 
 
 class TestSchemaAnalyzer:
     """Tests for the SchemaAnalyzer class."""
 
-    def test_analyze_returns_all_expected_keys(self, mock_connector: MagicMock) -> None:
+    def test_analyze_returns_all_expected_keys(self, mock_connector: BaseConnector) -> None:
         """analyze() must return tables, views, SPs, functions, indexes, and overview."""
         analyzer = SchemaAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -26,7 +25,7 @@ class TestSchemaAnalyzer:
         }
         assert expected_keys == set(result.keys())
 
-    def test_tables_have_columns_and_pk_flag(self, mock_connector: MagicMock) -> None:
+    def test_tables_have_columns_and_pk_flag(self, mock_connector: BaseConnector) -> None:
         """Each table dict should contain columns list, column_count, and has_primary_key."""
         analyzer = SchemaAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -39,7 +38,7 @@ class TestSchemaAnalyzer:
         assert students["has_primary_key"] is True
         assert len(students["columns"]) == 7
 
-    def test_tables_without_pk_are_flagged(self, mock_connector: MagicMock) -> None:
+    def test_tables_without_pk_are_flagged(self, mock_connector: BaseConnector) -> None:
         """AuditLog has no PK column (is_primary_key == 0), so has_primary_key should be False."""
         analyzer = SchemaAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -48,7 +47,7 @@ class TestSchemaAnalyzer:
         audit = next(t for t in tables if t["TABLE_NAME"] == "AuditLog")
         assert audit["has_primary_key"] is False
 
-    def test_overview_counts_are_correct(self, mock_connector: MagicMock) -> None:
+    def test_overview_counts_are_correct(self, mock_connector: BaseConnector) -> None:
         """The overview dict should have accurate counts for all object types."""
         analyzer = SchemaAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -61,7 +60,7 @@ class TestSchemaAnalyzer:
         assert overview["indexes"] == 6
         assert overview["foreign_keys"] == 5
 
-    def test_overview_total_rows(self, mock_connector: MagicMock) -> None:
+    def test_overview_total_rows(self, mock_connector: BaseConnector) -> None:
         """Total rows should sum across all tables."""
         analyzer = SchemaAnalyzer(mock_connector)
         result = analyzer.analyze()
@@ -70,7 +69,7 @@ class TestSchemaAnalyzer:
         # 15000 + 200 + 45000 + 90000 + 32000 + 12 + 0 + 0 = 182212
         assert overview["total_rows"] == 182212
 
-    def test_overview_total_columns(self, mock_connector: MagicMock) -> None:
+    def test_overview_total_columns(self, mock_connector: BaseConnector) -> None:
         """Total columns should sum column_count across all tables."""
         analyzer = SchemaAnalyzer(mock_connector)
         result = analyzer.analyze()
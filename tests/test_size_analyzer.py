@@ -5,23 +5,24 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 from sqlforensic.analyzers.size_analyzer import SizeAnalyzer
+from sqlforensic.connectors.base import BaseConnector
 
 
 class TestSizeAnalyzer:
-    def test_returns_sorted_by_size_descending(self, mock_connector: MagicMock) -> None:
+    def test_returns_sorted_by_size_descending(self, mock_connector: BaseConnector) -> None:
         analyzer = SizeAnalyzer(mock_connector)
         results = analyzer.analyze()
         sizes = [r["total_space_kb"] for r in results]
         assert sizes == sorted(sizes, reverse=True)
 
-    def test_all_tables_present(self, mock_connector: MagicMock) -> None:
+    def test_all_tables_present(self, mock_connector: BaseConnector) -> None:
         analyzer = SizeAnalyzer(mock_connector)
         results = analyzer.analyze()
         names = {r["table_name"] for r in results}
         assert "Grades" in names
         assert "Students" in names
 
-    def test_result_has_required_fields(self, mock_connector: MagicMock) -> None:
+    def test_result_has_required_fields(self, mock_connector: BaseConnector) -> None:
         analyzer = SizeAnalyzer(mock_connector)
         results = analyzer.analyze()
         for r in results:
@@ -33,13 +34,13 @@ class TestSizeAnalyzer:
             assert "unused_space_kb" in r
             assert "avg_row_size_bytes" in r
 
-    def test_unused_space_calculated(self, mock_connector: MagicMock) -> None:
+    def test_unused_space_calculated(self, mock_connector: BaseConnector) -> None:
         analyzer = SizeAnalyzer(mock_connector)
         results = analyzer.analyze()
         for r in results:
             assert r["unused_space_kb"] == r["total_space_kb"] - r["used_space_kb"]
 
-    def test_avg_row_size_positive_for_nonempty(self, mock_connector: MagicMock) -> None:
+    def test_avg_row_size_positive_for_nonempty(self, mock_connector: BaseConnector) -> None:
         analyzer = SizeAnalyzer(mock_connector)
         results = analyzer.analyze()
         for r in results:
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 from sqlforensic.analyzers.sp_analyzer import SPAnalyzer
+from sqlforensic.connectors.base import BaseConnector
 
 
 class TestSPAnalyzer:
     """Tests for stored procedure analysis and complexity scoring."""
 
-    def test_analyze_returns_one_entry_per_sp(self, mock_connector: MagicMock) -> None:
+    def test_analyze_returns_one_entry_per_sp(self, mock_connector: BaseConnector) -> None:
         """Result list should contain one entry per stored procedure."""
         sps = mock_connector.get_stored_procedures()
         analyzer = SPAnalyzer(mock_connector, sps)
@@ -18,7 +17,7 @@ class TestSPAnalyzer:
 
         assert len(result) == len(sps)
 
-    def test_results_sorted_by_complexity_descending(self, mock_connector: MagicMock) -> None:
+    def test_results_sorted_by_complexity_descending(self, mock_connector: BaseConnector) -> None:
         """Results should be sorted from highest to lowest complexity score."""
         sps = mock_connector.get_stored_procedures()
         analyzer = SPAnalyzer(mock_connector, sps)
@@ -27,7 +26,7 @@ class TestSPAnalyzer:
         scores = [r["complexity_score"] for r in result]
         assert scores == sorted(scores, reverse=True)
 
-    def test_sp_get_student_grades_is_medium(self, mock_connector: MagicMock) -> None:
+    def test_sp_get_student_grades_is_medium(self, mock_connector: BaseConnector) -> None:
         """sp_GetStudentGrades has 3 JOINs but no cursors so should be Medium."""
         sps = mock_connector.get_stored_procedures()
         analyzer = SPAnalyzer(mock_connector, sps)
@@ -38,7 +37,7 @@ class TestSPAnalyzer:
         assert sp["has_cursors"] is False
         assert sp["complexity_category"] in ("Simple", "Medium")
 
-    def test_sp_enroll_student_detects_cursor(self, mock_connector: MagicMock) -> None:
+    def test_sp_enroll_student_detects_cursor(self, mock_connector: BaseConnector) -> None:
         """sp_EnrollStudent uses CURSOR and should be flagged accordingly."""
         sps = mock_connector.get_stored_procedures()
         analyzer = SPAnalyzer(mock_connector, sps)
@@ -49,7 +48,7 @@ class TestSPAnalyzer:
         assert sp["has_temp_tables"] is True
         assert "Cursor usage" in " ".join(sp["anti_patterns"])
 
-    def test_each_result_has_required_fields(self, mock_connector: MagicMock) -> None:
+    def test_each_result_has_required_fields(self, mock_connector: BaseConnector) -> None:
         """Every SP result dict must have the full set of expected keys."""
         sps = mock_connector.get_stored_procedures()
         analyzer = SPAnalyzer(mock_connector, sps)
@@ -77,7 +76,7 @@ class TestSPAnalyzer:
                 f"{sp_result['name']} is missing keys: {required_keys - sp_result.keys()}"
             )
 
-    def test_sp_dynamic_search_pattern(self, mock_connector: MagicMock) -> None:
+    def test_sp_dynamic_search_pattern(self, mock_connector: BaseConnector) -> None:
         """sp_DynamicSearch uses EXEC(@sql) which is a dynamic SQL indicator.
 
         Note: the current DYNAMIC_SQL_PATTERN matches EXEC('...' or EXEC @var
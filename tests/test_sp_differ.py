@@ -175,3 +175,15 @@ class TestSPDiffer:
         # And that actual content changes DO produce different hashes
         body_c = "CREATE PROCEDURE sp_Test AS SELECT 2"
         assert hash_body(body_a) != hash_body(body_c)
+
+    def test_shared_object_not_modified(self) -> None:
+        """An object dict present in both source and target is never reported as modified."""
+        shared = {
+            "ROUTINE_SCHEMA": "dbo",
+            "ROUTINE_NAME": "sp_Shared",
+            "ROUTINE_DEFINITION": "CREATE PROCEDURE sp_Shared AS SELECT 1",
+        }
+
+        result = diff_procedures([shared], [shared])
+
+        assert result.modified == []
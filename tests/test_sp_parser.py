@@ -118,3 +118,112 @@ END
         assert "Enrollments" in result.crud_operations["INSERT"]
         assert "Payments" in result.crud_operations["UPDATE"]
         assert "AuditLog" in result.crud_operations["DELETE"]
+
+    def test_parse_many_matches_parse(self) -> None:
+        """parse_many() should return the same results as parse(), in input order."""
+        parser = SPParser()
+        sps = [
+            {
+                "ROUTINE_SCHEMA": "dbo",
+                "ROUTINE_NAME": f"sp_Get{i}",
+                "ROUTINE_DEFINITION": f"CREATE PROCEDURE sp_Get{i} AS SELECT * FROM Table{i}",
+            }
+            for i in range(5)
+        ]
+
+        assert parser.parse_many(sps) == [parser.parse(sp) for sp in sps]
+
+    def test_parse_many_process_pool(self) -> None:
+        """Large batches parsed in worker processes should match in-process parsing."""
+        from sqlforensic.parsers import sp_parser
+
+        parser = SPParser()
+        sps = [
+            {
+                "ROUTINE_SCHEMA": "dbo",
+                "ROUTINE_NAME": f"sp_Upd{i}",
+                "ROUTINE_DEFINITION": f"UPDATE Orders SET Total = {i} WHERE Id IN (SELECT 1)",
+            }
+            for i in range(sp_parser._PARALLEL_MIN_SPS)
+        ]
+
+        assert parser.parse_many(sps, workers=2) == parser.parse_many(sps, workers=1)
+
+    def test_parse_many_serial_by_default(self) -> None:
+        """Without an explicit worker count no process pool is started."""
+        from unittest.mock import patch
+
+        from sqlforensic.parsers import sp_parser
+
+        sps = [
+            {"ROUTINE_NAME": f"sp_{i}", "ROUTINE_DEFINITION": "SELECT 1"}
+            for i in range(sp_parser._PARALLEL_MIN_SPS)
+        ]
+        with patch.object(sp_parser, "ProcessPoolExecutor") as pool:
+            results = SPParser().parse_many(sps)
+
+        pool.assert_not_called()
+        assert len(results) == len(sps)
+
+    def test_parenthesized_header_takes_precedence(self) -> None:
+        """A parenthesized header is used even when a bare header appears first."""
+        parser = SPParser()
+        sp = {
+            "ROUTINE_SCHEMA": "dbo",
+            "ROUTINE_NAME": "sp_B",
+            "ROUTINE_DEFINITION": (
+                "CREATE PROCEDURE sp_A @x INT, @w INT AS SELECT 1\nGO\n"
+                "CREATE PROCEDURE sp_B (@y INT, @z INT) AS SELECT 2"
+            ),
+        }
+
+        result = parser.parse(sp)
+
+        assert [p["name"] for p in result.parameters] == ["@y"]
+
+    def test_scans_are_case_insensitive_and_keep_name_case(self) -> None:
+        """Keywords match in any case; captured table names keep their original case."""
+        parser = SPParser()
+        upper = parser.parse(
+            {
+                "ROUTINE_NAME": "sp_Upper",
+                "ROUTINE_DEFINITION": "SELECT * FROM Orders o INNER JOIN OrderItems i ON 1=1",
+            }
+        )
+        mixed = parser.parse(
+            {
+                "ROUTINE_NAME": "sp_Mixed",
+                "ROUTINE_DEFINITION": "sElEcT * fRoM Orders o iNnEr JoIn OrderItems i ON 1=1",
+            }
+        )
+        non_ascii = parser.parse(
+            {
+                "ROUTINE_NAME": "sp_Accent",
+                "ROUTINE_DEFINITION": "select * from Élèves e join OrderItems i on 1=1",
+            }
+        )
+
+        assert upper.referenced_tables == ["OrderItems", "Orders"]
+        assert mixed.referenced_tables == upper.referenced_tables
+        assert mixed.join_count == upper.join_count == 1
+        assert mixed.anti_patterns == upper.anti_patterns
+        assert non_ascii.referenced_tables == ["OrderItems", "Élèves"]
+
+    def test_body_patterns_safe_to_lowercase(self) -> None:
+        """The lowercase scan patterns rely on the sources having no uppercase escapes."""
+        import re
+        from dataclasses import astuple
+
+        from sqlforensic.parsers import sp_parser
+
+        for pattern in astuple(sp_parser._IGNORECASE_PATTERNS):
+            assert not re.search(r"\\[A-Z]", pattern.pattern), pattern.pattern
+
+    def test_literal_checks_match_between_ascii_and_non_ascii_bodies(self) -> None:
+        """NOLOCK and sp_executesql checks should agree on lowered and raw scans."""
+        parser = SPParser()
+        ascii_body = "SELECT a FROM Orders WITH (NoLock); EXEC (@sql); EXEC Sp_ExecuteSql @sql"
+        for body in (ascii_body, ascii_body + " -- Élèves"):
+            result = parser.parse({"ROUTINE_NAME": "sp_Hints", "ROUTINE_DEFINITION": body})
+            assert result.has_dynamic_sql
+            assert result.anti_patterns == ["NOLOCK hint — may cause dirty reads"]
@@ -10,14 +10,17 @@ from sqlforensic.utils.sql_patterns import (
     DELETE_PATTERN,
     DYNAMIC_SQL_PATTERN,
     FK_NAMING_PATTERN,
+    FK_NAMING_RE,
     INSERT_PATTERN,
     JOIN_PATTERN,
+    JOIN_RE,
     NOLOCK_PATTERN,
     SCHEMA_QUALIFIED_PATTERN,
     SELECT_FROM_PATTERN,
     SELECT_STAR_PATTERN,
     SUBQUERY_PATTERN,
     TABLE_REF_PATTERN,
+    TABLE_REF_RE,
     TEMP_TABLE_PATTERN,
     UPDATE_PATTERN,
 )
@@ -56,6 +59,10 @@ class TestJoinPattern:
     def test_plain_join(self) -> None:
         assert re.search(JOIN_PATTERN, "JOIN Users u ON 1=1", re.IGNORECASE)
 
+    def test_long_whitespace_run_scans_linearly(self) -> None:
+        body = "SELECT 1 FROM A" + " " * 50_000 + "JOIN B ON 1=1"
+        assert [m.group(2) for m in JOIN_RE.finditer(body)] == ["B"]
+
 
 class TestSelectFromPattern:
     def test_simple(self) -> None:
@@ -172,3 +179,17 @@ class TestSchemaQualifiedPattern:
     def test_bracketed(self) -> None:
         m = re.search(SCHEMA_QUALIFIED_PATTERN, "[dbo].[Students]")
         assert m
+
+
+class TestCompiledPatterns:
+    def test_compiled_forms_are_case_insensitive(self) -> None:
+        assert JOIN_RE.pattern == JOIN_PATTERN
+        assert JOIN_RE.flags & re.IGNORECASE
+        m = TABLE_REF_RE.search("select * from dbo.Students")
+        assert m
+        assert m.group(2) == "Students"
+
+    def test_fk_naming_compiled_stays_case_sensitive(self) -> None:
+        assert FK_NAMING_RE.pattern == FK_NAMING_PATTERN
+        assert not FK_NAMING_RE.flags & re.IGNORECASE
+        assert not FK_NAMING_RE.match("StudentiD")